@@ -1,16 +1,31 @@
+import logging
 import os
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.support.ui import WebDriverWait
+
+from pages.admin.admin_dashboard_page import AdminDashboardPage
+from pages.admin.admin_products_page import AdminProductsPage
+from pages.login_page import LoginPage
+from utils.breaker import CircuitBreaker
+from utils.budget import budget
+from utils.catalog import load_catalog
+from utils.drivers import create_driver
+from utils.impact import ImpactPlugin
+from utils.matrix import BrowserMatrix, split_browsers
+from utils.resources import ResourceMonitor, psutil
+from utils.standby import StandbyPool
+from utils.static import StaticClient, StaticDriver, lxml
+from utils.tabs import TabRunner
+from utils.timing import TimingCollector
+from utils.visits import SharedVisits
+from utils.waits import BudgetWait
+
+logger = logging.getLogger(__name__)
+cleanup_result_key = pytest.StashKey[dict]()
 
 
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="chrome",
-                     help="chrome | firefox | safari")
+                     help="chrome | firefox | safari; через запятую — матрица браузеров параллельно")
     parser.addoption("--base-url", action="store", default="https://demo.opencart.com",
                      help="Base URL of OpenCart")
     parser.addoption("--admin-path", action="store", default="/administration",
@@ -21,6 +36,86 @@ def pytest_addoption(parser):
                      help="Admin password")
     parser.addoption("--headless", action="store_true", default=False,
                      help="Run browser in headless mode")
+    parser.addoption("--catalog-ttl", action="store", type=int, default=3600,
+                     help="TTL (сек) дискового кеша индекса каталога, 0 — без кеша")
+    parser.addoption("--catalog-workers", action="store", type=int, default=8,
+                     help="Число параллельных HTTP-запросов при обходе каталога")
+    parser.addoption("--impact-record", action="store_true", default=False,
+                     help="Записать карту: какие page objects, локаторы и хелперы использует каждый тест")
+    parser.addoption("--impact", action="store_true", default=False,
+                     help="Запустить только тесты, затронутые изменениями в pages/, utils/, tests/")
+    parser.addoption("--tabs", action="store", type=int, default=4,
+                     help="Сколько вкладок одного браузера грузят страницы одновременно (tab_runner)")
+    parser.addoption("--lean", action="store_true", default=False,
+                     help="Запускать браузер с флагами экономии памяти")
+    parser.addoption("--monitor-resources", action="store_true", default=False,
+                     help="Замерять CPU и RSS драйвера и браузера по каждому тесту (нужен psutil)")
+    parser.addoption("--resources-interval", action="store", type=float, default=0.5,
+                     help="Период опроса CPU/RSS, сек")
+    parser.addoption("--mem-budget-mb", action="store", type=float, default=0,
+                     help="Бюджет памяти браузера на тест, MB (0 — без бюджета)")
+    parser.addoption("--mem-budget-action", action="store", default="warn", choices=("warn", "fail"),
+                     help="Что делать при превышении бюджета памяти: warn | fail")
+    parser.addoption("--timing", action="store_true", default=False,
+                     help="Собирать Navigation/Resource Timing каждого перехода (отчёт — по --timing-out)")
+    parser.addoption("--timing-out", action="store", default=None, metavar="PREFIX",
+                     help="Куда писать отчёт --timing: PREFIX.json/.csv (по умолчанию <cache-dir>/timing)")
+    parser.addoption("--run-budget", action="store", type=float, default=0,
+                     help="Бюджет времени на весь прогон, сек (0 — без ограничения)")
+    parser.addoption("--test-budget", action="store", type=float, default=0,
+                     help="Бюджет времени на тест, сек: ожидания ужимаются до остатка (0 — без ограничения)")
+    parser.addoption("--breaker-threshold", action="store", type=int, default=3,
+                     help="После скольких одинаковых падений ожиданий остальные тесты тех же модулей падают сразу")
+    parser.addoption("--no-breaker", action="store_true", default=False,
+                     help="Не останавливать прогон при системных ошибках")
+    parser.addoption("--no-preflight", action="store_true", default=False,
+                     help="Не проверять доступность --base-url перед прогоном")
+    parser.addoption("--static", action="store_true", default=False,
+                     help="Тесты с маркером static проверяют HTML без браузера (браузер — только где нужен JS)")
+    parser.addoption("--shared-visits", action="store_true", default=False,
+                     help="Тесты с маркером visit идут подряд по URL в одном браузере (меняет порядок тестов)")
+    parser.addoption("--standby", action="store", type=int, default=0,
+                     help="Сколько запасных браузеров держать запущенными в фоне (0 — запуск по требованию)")
+    parser.addoption("--cleanup-prefix", action="store", default="PO Test ",
+                     help="Префикс названий тестовых товаров, удаляемых в конце сессии (пусто — не удалять)")
+    parser.addoption("--cache-dir", action="store", default=".cache",
+                     help="Каталог кешей и отчётов (товары, impact-карта, история ресурсов, timing); "
+                          "относительный путь — от корня проекта")
+
+
+def cache_path(config, *parts):
+    """Путь внутри --cache-dir, привязанный к корню проекта, а не к текущему каталогу."""
+    return os.path.join(str(config.rootpath), config.getoption("--cache-dir"), *parts)
+
+
+# tryfirst: BrowserMatrix должен забрать --junitxml раньше, чем плагин junitxml откроет свой отчёт
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    browsers = split_browsers(config.getoption("--browser"))
+    if len(browsers) > 1:
+        # сам процесс тесты не гоняет: по процессу pytest на браузер, отчёты сводятся в один
+        config.pluginmanager.register(
+            BrowserMatrix(config, browsers, cleanup=lambda: _cleanup_products(config, browsers[0])), "matrix")
+    config.pluginmanager.register(CircuitBreaker(config), "breaker")
+    if config.getoption("--impact-record") or config.getoption("--impact"):
+        config.pluginmanager.register(ImpactPlugin(config), "impact")
+    if config.getoption("--monitor-resources"):
+        if psutil is None:
+            raise pytest.UsageError("--monitor-resources требует пакет psutil")
+        config.pluginmanager.register(ResourceMonitor(config), "resources")
+    if config.getoption("--timing"):
+        config.pluginmanager.register(
+            TimingCollector(config.getoption("--timing-out") or cache_path(config, "timing"), admin_path=config.getoption("--admin-path")),
+            "timing")
+    if config.getoption("--standby") > 0 and not config.pluginmanager.has_plugin("matrix"):
+        config.pluginmanager.register(
+            StandbyPool(lambda: _launch_driver(config), size=config.getoption("--standby")), "standby")
+    if config.getoption("--shared-visits"):
+        config.pluginmanager.register(SharedVisits(config), "visits")
+    if config.getoption("--static"):
+        if lxml is None:
+            raise pytest.UsageError("--static требует пакеты lxml и cssselect")
+        config.pluginmanager.register(StaticClient(config.getoption("--base-url")), "static")
 
 
 @pytest.fixture(scope="session")
@@ -42,39 +137,124 @@ def admin_creds(request):
     }
 
 
+@pytest.fixture(scope="session")
+def catalog(request, base_url):
+    """Индекс товаров витрины, построенный HTTP-обходом (кешируется на диске)"""
+    return load_catalog(base_url,
+                        ttl=request.config.getoption("--catalog-ttl"),
+                        workers=request.config.getoption("--catalog-workers"),
+                        cache_dir=cache_path(request.config))
+
+
+def _cleanup_products(config, browser=None):
+    """Удаляет товары, созданные admin-тестами (по префиксу названия); итог — в config.stash."""
+    prefix = config.getoption("--cleanup-prefix")
+    user, password = config.getoption("--admin-username"), config.getoption("--admin-password")
+    if not prefix or not user or not password:
+        return
+    base_url = config.getoption("--base-url").rstrip("/")
+    admin_path = "/" + config.getoption("--admin-path").lstrip("/")
+    driver = create_driver(browser or config.getoption("--browser"), headless=True,
+                           lean=config.getoption("--lean"))
+    try:
+        LoginPage(driver).open_admin(base_url, admin_path).login(user, password)
+        AdminDashboardPage(driver).is_opened()
+        result = AdminProductsPage(driver).cleanup_products(base_url, admin_path, prefix)
+        config.stash[cleanup_result_key] = {"prefix": prefix, **result}
+    except Exception as e:
+        logger.warning(f"Очистка тестовых товаров не удалась: {e}")
+    finally:
+        driver.quit()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def admin_cleanup(request):
+    """После сессии удаляет товары, созданные admin-тестами (в матрице браузеров — один раз, в родителе)"""
+    yield
+    ran_admin = any(item.get_closest_marker("admin") for item in request.session.items)
+    # стенд недоступен или вход в админку сломан — чистить некуда
+    breaker = request.config.pluginmanager.get_plugin("breaker")
+    stand_down = {"all", "admin"} & set(breaker.tripped)
+    if ran_admin and not stand_down:
+        _cleanup_products(request.config)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    result = config.stash.get(cleanup_result_key, None)
+    if result:
+        terminalreporter.write_line(
+            f"cleanup: удалено товаров '{result['prefix']}*': {result['removed']} за {result['seconds']}s")
+
+
+def _launch_driver(config):
+    driver = create_driver(config.getoption("--browser"),
+                           headless=config.getoption("--headless"),
+                           lean=config.getoption("--lean"))
+    driver.implicitly_wait(2)
+    timing = config.pluginmanager.get_plugin("timing")
+    if timing:
+        timing.attach(driver)
+    return driver
+
+
+def _new_driver(config):
+    """Чистый браузер: из запаса --standby, если он включён, иначе запуск на месте."""
+    standby = config.pluginmanager.get_plugin("standby")
+    driver = standby.acquire() if standby else _launch_driver(config)
+    # таймаут ставим при выдаче: бюджет времени считается от текущего теста
+    driver.set_page_load_timeout(budget.timeout(30) or 1)
+    return driver
+
+
 @pytest.fixture
 def browser(request):
     """Фикстура для запуска браузера"""
-    name = request.config.getoption("--browser").lower()
-    headless = request.config.getoption("--headless")
-
-    if name == "chrome":
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--window-size=1280,900")
-        driver = webdriver.Chrome(service=ChromeService(), options=options)
-
-    elif name == "firefox":
-        options = FirefoxOptions()
-        if headless:
-            options.add_argument("-headless")
-        driver = webdriver.Firefox(service=FirefoxService(), options=options)
-        driver.set_window_size(1280, 900)
-
-    elif name == "safari":
-        driver = webdriver.Safari()
+    static = request.config.pluginmanager.get_plugin("static")
+    if static and request.node.get_closest_marker("static"):
+        # браузер поднимется, только если какой-то локатор не проверить по HTML
+        driver = StaticDriver(static, fallback=lambda: _new_driver(request.config))
+        yield driver
+        driver.quit()
+        return
 
+    visits = request.config.pluginmanager.get_plugin("visits")
+    shared = visits is not None and request.node.get_closest_marker("visit") is not None
+    if shared:
+        # общий браузер сессии, страница уже загружена; закрывает его сам SharedVisits
+        driver = visits.driver_for(request.node, lambda: _new_driver(request.config))
     else:
-        raise pytest.UsageError(f"Unknown --browser={name}")
+        driver = _new_driver(request.config)
+    monitor = request.config.pluginmanager.get_plugin("resources")
+    if monitor:
+        monitor.start(request.node, driver)
+    yield driver
+    timing = request.config.pluginmanager.get_plugin("timing")
+    if timing:
+        timing.collect(driver)
+    if monitor:
+        monitor.stop(request.node)
+    if not shared:
+        driver.quit()
+
 
+@pytest.fixture
+def tab_runner(request):
+    """Один браузер на несколько вкладок для параллельных read-only проверок"""
+    driver = create_driver(request.config.getoption("--browser"),
+                           headless=request.config.getoption("--headless"),
+                           page_load_strategy="none",
+                           lean=request.config.getoption("--lean"))
     driver.set_page_load_timeout(30)
-    driver.implicitly_wait(2)
-    yield driver
+    monitor = request.config.pluginmanager.get_plugin("resources")
+    if monitor:
+        monitor.start(request.node, driver)
+    yield TabRunner(driver, tabs=request.config.getoption("--tabs"))
+    if monitor:
+        monitor.stop(request.node)
     driver.quit()
 
 
 @pytest.fixture
 def wait(browser):
     """Явные ожидания по умолчанию"""
-    return WebDriverWait(browser, 10)
+    return BudgetWait(browser, 10)
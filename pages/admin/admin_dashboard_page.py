@@ -1,12 +1,17 @@
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from selenium.common.exceptions import TimeoutException
+from pages.base import BasePage, Element
+from utils.breaker import ADMIN_LOGIN_FAILED
 
 class AdminDashboardPage(BasePage):
-    MENU = (By.ID, "menu")
-    LOGOUT = (By.CSS_SELECTOR, "a[href*='logout']")
+    MENU = Element(By.ID, "menu")
+    LOGOUT = Element(By.CSS_SELECTOR, "a[href*='logout']")
 
     def is_opened(self):
-        return self.wait_visible(self.MENU)
+        try:
+            return self.wait_visible(self.MENU)
+        except TimeoutException:
+            raise TimeoutException(f"{ADMIN_LOGIN_FAILED}: главное меню не появилось")
 
     def logout(self):
         self.click(self.LOGOUT)
@@ -1,11 +1,11 @@
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from pages.base import BasePage, Element
 
 class AdminLoginPage(BasePage):
-    USER = (By.CSS_SELECTOR, "#input-username")
-    PASS = (By.CSS_SELECTOR, "#input-password")
-    SUBMIT = (By.CSS_SELECTOR, "button[type='submit']")
-    FORM = (By.CSS_SELECTOR, "form")
+    USER = Element(By.CSS_SELECTOR, "#input-username")
+    PASS = Element(By.CSS_SELECTOR, "#input-password")
+    SUBMIT = Element(By.CSS_SELECTOR, "button[type='submit']")
+    FORM = Element(By.CSS_SELECTOR, "form")
 
     def open_admin(self, base_url: str, admin_path: str = "/administration"):
         path = admin_path if admin_path.startswith("/") else f"/{admin_path}"
@@ -1,40 +1,119 @@
+import time
+
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from pages.base import BasePage, Element
+from pages.admin.admin_routes import AdminRouter
 
 class AdminProductsPage(BasePage):
-    MENU_CATALOG = (By.ID, "menu-catalog")
-    PRODUCTS_LINK = (By.LINK_TEXT, "Products")
-    ADD_BUTTON = (By.CSS_SELECTOR, "a[data-original-title='Add New'], .btn-primary")
-    DELETE_BUTTON = (By.CSS_SELECTOR, "button[data-original-title='Delete'], .btn-danger")
-    SAVE_BUTTON = (By.CSS_SELECTOR, "button[data-original-title='Save'], .btn-primary")
-    SUCCESS_ALERT = (By.CSS_SELECTOR, ".alert-success")
+    MENU_CATALOG = Element(By.ID, "menu-catalog")
+    PRODUCTS_LINK = Element(By.LINK_TEXT, "Products")
+    ADD_BUTTON = Element(By.CSS_SELECTOR, "a[data-original-title='Add New'], .btn-primary")
+    DELETE_BUTTON = Element(By.CSS_SELECTOR, "button[data-original-title='Delete'], .btn-danger")
+    SAVE_BUTTON = Element(By.CSS_SELECTOR, "button[data-original-title='Save'], .btn-primary")
+    SUCCESS_ALERT = Element(By.CSS_SELECTOR, ".alert-success")
+    # области, где ищутся ошибки отправки: поля формы товара и контейнер уведомлений списка
+    FORM_SCOPE = "#form-product"
+    ALERTS_SCOPE = "#alert"
 
     # поля товара
-    NAME_INPUT = (By.CSS_SELECTOR, "#input-name1")
-    META_TITLE_INPUT = (By.CSS_SELECTOR, "#input-meta-title1")
-    MODEL_INPUT = (By.CSS_SELECTOR, "#input-model")
+    NAME_INPUT = Element(By.CSS_SELECTOR, "#input-name1")
+    META_TITLE_INPUT = Element(By.CSS_SELECTOR, "#input-meta-title1")
+    MODEL_INPUT = Element(By.CSS_SELECTOR, "#input-model")
+
+    _router = None
+
+    # Отмечает в таблице товары, чьё название начинается с префикса; возвращает число отмеченных
+    # и есть ли следующая страница списка
+    SELECT_BY_PREFIX_JS = """
+    var prefix = arguments[0], limit = arguments[1], selected = 0;
+    document.querySelectorAll("table tbody tr").forEach(function (row) {
+        var box = row.querySelector("input[type='checkbox'][name^='selected']");
+        var name = row.querySelector("td.text-start, td.text-left");
+        if (!box || !name || selected >= limit) { return; }
+        if (name.textContent.trim().indexOf(prefix) === 0) {
+            box.checked = true;
+            selected++;
+        }
+    });
+    var next = document.querySelector(".pagination .active + li a, .pagination li.active + li a");
+    return {selected: selected, has_next: !!next};
+    """
+
+    @property
+    def router(self):
+        """AdminRouter; если open_products ещё не вызывали — по адресу текущей страницы админки."""
+        if self._router is None:
+            self._router = AdminRouter.from_current_url(self.driver)
+        return self._router
 
-    def open_products(self, base_url, admin_path):
+    @router.setter
+    def router(self, router):
+        self._router = router
+
+    def open_products(self, base_url, admin_path, via_menu=False):
+        self.router = AdminRouter(self.driver, base_url, admin_path)
+        if not via_menu and self.router.token():
+            # прямая ссылка с user_token вместо загрузки дашборда и двух кликов по меню
+            return self.open(self.router.url("products"))
         self.open(base_url + admin_path)
         # открыть "Catalog → Products"
         self.click(self.MENU_CATALOG)
         self.click(self.PRODUCTS_LINK)
         return self
 
+    def open_product_form(self, product_id=None):
+        params = {"product_id": product_id} if product_id else {}
+        return self.open(self.router.url("product_form", **params))
+
+    @staticmethod
+    def _expect_success(verdict, what):
+        if not verdict["ok"]:
+            raise AssertionError(f"{what} ({verdict['state']}): {'; '.join(verdict['messages']) or 'нет сообщений'}")
+
     def add_product(self, name="Test Product", meta="Test Meta", model="TP123"):
-        self.click(self.ADD_BUTTON)
-        self.type(self.NAME_INPUT, name)
-        self.type(self.META_TITLE_INPUT, meta)
-        self.click((By.LINK_TEXT, "Data"))
-        self.type(self.MODEL_INPUT, model)
-        self.click(self.SAVE_BUTTON)
-        return self.wait_visible(self.SUCCESS_ALERT)
+        if self.router.token():
+            self.open_product_form()
+        else:
+            self.click(self.ADD_BUTTON)
+        self.wait_visible(AdminProductsPage.NAME_INPUT)
+        # поле модели на вкладке Data: значение ставится скриптом, переключать вкладку не нужно
+        self.fill_form({
+            AdminProductsPage.NAME_INPUT: name,
+            AdminProductsPage.META_TITLE_INPUT: meta,
+            AdminProductsPage.MODEL_INPUT: model,
+        })
+        self._expect_success(self.submit(AdminProductsPage.SAVE_BUTTON, alert_success=True,
+                                         scope=self.FORM_SCOPE), "Товар не сохранён")
+        return self.wait_visible(AdminProductsPage.SUCCESS_ALERT)
 
     def delete_first_product(self):
         # кликнуть чекбокс в первой строке таблицы
         checkbox = self.wait_visible((By.CSS_SELECTOR, "table tbody tr:first-child input[type='checkbox']"))
         self.driver.execute_script("arguments[0].click();", checkbox)
-        self.click(self.DELETE_BUTTON)
-        alert = self.driver.switch_to.alert
-        alert.accept()
-        return self.wait_visible(self.SUCCESS_ALERT)
+        verdict = self.submit(AdminProductsPage.DELETE_BUTTON, alert_success=True, confirm=True,
+                              scope=self.ALERTS_SCOPE)
+        self._expect_success(verdict, "Товар не удалён")
+        return self.wait_visible(AdminProductsPage.SUCCESS_ALERT)
+
+    def cleanup_products(self, base_url, admin_path, prefix, batch_size=100, max_batches=200):
+        """
+        Удаляет все товары с названием на prefix: фильтрует список, обходит страницы,
+        отмечает подходящие строки одним скриптом и удаляет пачкой. Возвращает {"removed", "seconds"}.
+        """
+        self.router = AdminRouter(self.driver, base_url, admin_path)
+        started = time.monotonic()
+        removed, page = 0, 1
+        for _ in range(max_batches):
+            self.open(self.router.url("products", filter_name=prefix, page=page))
+            self.wait_visible((By.CSS_SELECTOR, "table"))
+            found = self.driver.execute_script(self.SELECT_BY_PREFIX_JS, prefix, batch_size)
+            if not found["selected"]:
+                if not found["has_next"]:
+                    break
+                page += 1
+                continue
+            verdict = self.submit(AdminProductsPage.DELETE_BUTTON, alert_success=True, confirm=True,
+                                  scope=self.ALERTS_SCOPE)
+            self._expect_success(verdict, "Товары не удалены")
+            removed += found["selected"]
+        return {"removed": removed, "seconds": round(time.monotonic() - started, 1)}
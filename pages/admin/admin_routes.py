@@ -0,0 +1,53 @@
+from urllib.parse import urlencode, urlparse, parse_qs
+
+# маршруты админки OpenCart 4 (в 4.0.2 действия отделяются точкой: catalog/product.form)
+ROUTES = {
+    "dashboard": "common/dashboard",
+    "products": "catalog/product",
+    "product_form": "catalog/product.form",
+    "categories": "catalog/category",
+    "customers": "customer/customer",
+    "customer_form": "customer/customer.form",
+    "orders": "sale/order",
+    "order_info": "sale/order.info",
+}
+
+
+class AdminRouter:
+    """Строит ссылки на экраны админки с user_token текущей сессии — без перехода через меню."""
+
+    def __init__(self, driver, base_url, admin_path="/administration"):
+        self.driver = driver
+        self.base_url = base_url.rstrip("/")
+        self.admin_path = admin_path if admin_path.startswith("/") else f"/{admin_path}"
+        self._token = None
+
+    @classmethod
+    def from_current_url(cls, driver):
+        """Роутер по адресу открытой страницы админки: base_url и admin_path берутся из него."""
+        parsed = urlparse(driver.current_url or "")
+        admin_path = parsed.path.rsplit("/index.php", 1)[0].rstrip("/") or "/"
+        return cls(driver, f"{parsed.scheme}://{parsed.netloc}", admin_path)
+
+    def token(self):
+        """user_token из адреса текущей страницы админки (None — вход ещё не выполнен)."""
+        if self._token is None:
+            query = parse_qs(urlparse(self.driver.current_url or "").query)
+            # OpenCart 3/4 — user_token, 2.x — token
+            values = query.get("user_token") or query.get("token")
+            self._token = values[0] if values else None
+        return self._token
+
+    def url(self, name, **params):
+        if name not in ROUTES:
+            raise KeyError(f"Неизвестный маршрут админки: {name}")
+        token = self.token()
+        if token is None:
+            raise RuntimeError("Нет user_token: сначала войдите в админку и откройте её страницу "
+                               "(например, AdminProductsPage.open_products)")
+        query = urlencode({"route": ROUTES[name], "user_token": token, **params})
+        return f"{self.base_url}{self.admin_path}/index.php?{query}"
+
+    def go(self, name, **params):
+        self.driver.get(self.url(name, **params))
+        return self
@@ -1,35 +1,239 @@
 # pages/base.py
+import time
+
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (StaleElementReferenceException, NoSuchElementException,
+                                        TimeoutException, WebDriverException)
+
+from utils import probe
+from utils.budget import budget
+
+# type() = поиск + проверка видимости + clear() + send_keys(): 4 запроса к драйверу на поле
+TYPE_ROUND_TRIPS = 4
+
+# стратегии By, которые FILL_FORM_JS ищет сам; поля с другими печатаются через type()
+FILL_FORM_STRATEGIES = {"id", "name", "class name", "tag name", "css selector", "xpath",
+                        "link text", "partial link text"}
+
+# Проставляет значения полям за один вызов и шлёт input/change, которые слушает валидация OpenCart
+FILL_FORM_JS = """
+function linkByText(value, partial) {
+    var links = document.getElementsByTagName('a');
+    for (var i = 0; i < links.length; i++) {
+        var text = (links[i].innerText || '').trim();
+        if (partial ? text.indexOf(value) !== -1 : text === value) { return links[i]; }
+    }
+    return null;
+}
+function find(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null,
+                                               XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text': return linkByText(value, false);
+        case 'partial link text': return linkByText(value, true);
+        default: throw new Error('fill_form: неподдерживаемая стратегия ' + by);
+    }
+}
+var missing = [];
+arguments[0].forEach(function (field) {
+    var el = find(field[0], field[1]);
+    if (!el) { missing.push(field[1]); return; }
+    if (el.type === 'checkbox' || el.type === 'radio') {
+        el.checked = !!field[2];
+    } else {
+        var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                  : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+                  : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field[2]);
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+
+class Element:
+    """Локатор-дескриптор.
+
+    И на классе, и на экземпляре страницы возвращает кортеж (by, value): само обращение к атрибуту
+    ничего не ищет и не ждёт. WebElement находят хелперы BasePage (click, type, wait_visible, ...)
+    с таймаутом и условием вызывающего и кешируют его до следующей навигации.
+    """
+
+    def __init__(self, by, value):
+        self.locator = (by, value)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        return self.locator
+
 
 class BasePage:
     def __init__(self, driver, base_url=None):
         self.driver = driver
         self.base_url = base_url
+        self._elements = {}   # locator -> WebElement
+        self._locators = {}   # WebElement.id -> locator
+        self.cache_stats = {"hits": 0, "misses": 0, "stale": 0}
+        self.round_trips_saved = 0
 
     def open(self, url):
         self.driver.get(url)
+        self.forget_elements()
         return self
 
+    def forget_elements(self):
+        """Сбрасывает кеш элементов (после навигации)."""
+        self._elements.clear()
+        self._locators.clear()
+
+    def element(self, locator, timeout=10):
+        """WebElement по локатору: из кеша, а при промахе — с ожиданием видимости."""
+        el = self._elements.get(locator)
+        if el is not None:
+            self.cache_stats["hits"] += 1
+            return el
+        self.cache_stats["misses"] += 1
+        el = WebDriverWait(self.driver, budget.timeout(timeout)).until(
+            EC.visibility_of_element_located(locator),
+            message=f"Не дождался элемента {locator}",
+        )
+        self._elements[locator] = el
+        self._locators[el.id] = locator
+        return el
+
+    def _describe(self, target):
+        """Локатор для сообщений об ошибке — в том числе для WebElement из кеша."""
+        if isinstance(target, WebElement):
+            return self._locators.get(target.id, target)
+        return target
+
+    def _with_element(self, target, action, timeout=10):
+        """Выполняет action(el); на устаревшей ссылке один раз переискивает элемент по локатору."""
+        if isinstance(target, WebElement):
+            el, locator = target, self._locators.get(target.id)
+        else:
+            el, locator = self.element(target, timeout), target
+        try:
+            return action(el)
+        except StaleElementReferenceException:
+            if locator is None:
+                raise
+            self.cache_stats["stale"] += 1
+            self._elements.pop(locator, None)
+            self._locators.pop(el.id, None)
+            return action(self.element(locator, timeout))
+
     def wait_visible(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
+        if not isinstance(locator, WebElement) and locator not in self._elements:
+            # промах кеша: element() уже дождался видимости
+            return self.element(locator, timeout)
+        return self._with_element(
+            locator,
+            lambda el: WebDriverWait(self.driver, budget.timeout(timeout)).until(
+                EC.visibility_of(el), message=f"Элемент {self._describe(locator)} не стал видимым"),
+            timeout,
         )
 
     def wait_clickable(self, locator, timeout=10):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
+        return self._with_element(
+            locator,
+            lambda el: WebDriverWait(self.driver, budget.timeout(timeout)).until(
+                EC.element_to_be_clickable(el), message=f"Элемент {self._describe(locator)} не стал кликабельным"),
+            timeout,
         )
 
     def click(self, locator):
-        el = self.wait_clickable(locator)
-        try:
-            el.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-            self.driver.execute_script("arguments[0].click();", el)
+        def _click(el):
+            el = WebDriverWait(self.driver, budget.timeout(10)).until(
+                EC.element_to_be_clickable(el), message=f"Элемент {self._describe(locator)} не стал кликабельным")
+            try:
+                el.click()
+            except StaleElementReferenceException:
+                raise
+            except Exception:
+                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+                self.driver.execute_script("arguments[0].click();", el)
+
+        self._with_element(locator, _click)
 
     def type(self, locator, text):
-        el = self.wait_visible(locator)
-        el.clear()
-        el.send_keys(text)
+        def _type(el):
+            el.clear()
+            el.send_keys(text)
+
+        self._with_element(locator, _type)
+
+    def fill_form(self, fields, realistic=(), optional=()):
+        """
+        Заполняет {locator: value} одним execute_script вместо type() на каждое поле.
+
+        realistic — локаторы полей, которым нужны настоящие нажатия клавиш (печатаются через type(),
+        как и поля со стратегией, которой нет в FILL_FORM_STRATEGIES),
+        optional — поля, которых может не быть на странице. Возвращает число сэкономленных запросов.
+        """
+        realistic = list(realistic) + [loc for loc in fields if loc[0] not in FILL_FORM_STRATEGIES
+                                       and loc not in realistic]
+        bulk = [(by, value, text) for (by, value), text in fields.items() if (by, value) not in realistic]
+        missing = self.driver.execute_script(FILL_FORM_JS, bulk) if bulk else []
+        optional_values = {value for _, value in optional}
+        required_missing = [value for value in missing if value not in optional_values]
+        if required_missing:
+            raise NoSuchElementException(f"Поля формы не найдены: {required_missing}")
+
+        for locator in realistic:
+            self.type(locator, fields[locator])
+
+        saved = max(0, TYPE_ROUND_TRIPS * (len(bulk) - len(missing)) - 1) if bulk else 0
+        self.round_trips_saved += saved
+        return saved
+
+    def submit(self, locator, success_urls=(), success_texts=(), alert_success=False, scope="",
+               confirm=False, timeout=10):
+        """
+        Нажимает locator и ждёт исход отправки формы — что наступит раньше: успех (часть URL,
+        текст в элементе success_texts=((css, текст),) или новый alert-success при alert_success),
+        ошибки у полей или предупреждение. Каждый опрос — один вызов probe.
+
+        confirm — принять JS-диалог подтверждения после клика.
+        Возвращает {"state": "success" | "invalid" | "alert" | "timeout", "ok", "url", "heading",
+        "errors": [{field, text}], "alerts": [{type, text}], "messages", "seconds"}.
+        """
+        url_before = probe.outcome_arm(self.driver)
+        started = time.monotonic()
+        self.click(locator)
+        if confirm:
+            WebDriverWait(self.driver, budget.timeout(5)).until(EC.alert_is_present()).accept()
+
+        snapshot = {}
+
+        def resolved(driver):
+            try:
+                snapshot.update(probe.outcome(driver, success_urls, success_texts, alert_success, scope))
+            except WebDriverException:
+                # страница перегружается (редирект после успеха) — ждём следующего опроса
+                return False
+            return snapshot["state"] != "pending"
+
+        try:
+            WebDriverWait(self.driver, budget.timeout(timeout), poll_frequency=0.1).until(resolved)
+        except TimeoutException:
+            snapshot["state"] = "timeout"
+
+        verdict = {"url": None, "heading": "", "errors": [], "alerts": [], **snapshot}
+        verdict["ok"] = verdict["state"] == "success"
+        verdict["messages"] = [e["text"] for e in verdict["errors"]] + [a["text"] for a in verdict["alerts"]]
+        verdict["seconds"] = round(time.monotonic() - started, 2)
+        if verdict["url"] != url_before:
+            self.forget_elements()
+        return verdict
@@ -1,12 +1,12 @@
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from pages.base import BasePage, Element
 
 class CategoryPage(BasePage):
-    BREADCRUMB = (By.CSS_SELECTOR, ".breadcrumb")
-    LEFT_MENU = (By.CSS_SELECTOR, ".list-group")
-    SORT = (By.CSS_SELECTOR, "#input-sort")
-    LIMIT = (By.CSS_SELECTOR, "#input-limit")
-    PRODUCT_TILES = (By.CSS_SELECTOR, ".product-layout, .product-thumb")
+    BREADCRUMB = Element(By.CSS_SELECTOR, ".breadcrumb")
+    LEFT_MENU = Element(By.CSS_SELECTOR, ".list-group")
+    SORT = Element(By.CSS_SELECTOR, "#input-sort")
+    LIMIT = Element(By.CSS_SELECTOR, "#input-limit")
+    PRODUCT_TILES = Element(By.CSS_SELECTOR, ".product-layout, .product-thumb")
 
     def open_by_path(self, base_url: str, path: str = "20"):
         url = f"{base_url}/index.php?route=product/category&path={path}"
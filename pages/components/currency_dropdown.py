@@ -1,9 +1,9 @@
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from pages.base import BasePage, Element
 
 class CurrencyDropdown(BasePage):
-    TOGGLE = (By.CSS_SELECTOR, "#form-currency .dropdown-toggle")
-    MENU = (By.CSS_SELECTOR, "#form-currency .dropdown-menu")
+    TOGGLE = Element(By.CSS_SELECTOR, "#form-currency .dropdown-toggle")
+    MENU = Element(By.CSS_SELECTOR, "#form-currency .dropdown-menu")
 
     def choose_currency(self, currency_name: str):
         self.click(self.TOGGLE)
@@ -1,10 +1,10 @@
 from selenium.webdriver.common.by import By
-from pages.base import BasePage
+from pages.base import BasePage, Element
 
 class LoginPage(BasePage):
-    USERNAME = (By.ID, "input-username")
-    PASSWORD = (By.ID, "input-password")
-    SUBMIT = (By.CSS_SELECTOR, "button[type='submit']")
+    USERNAME = Element(By.ID, "input-username")
+    PASSWORD = Element(By.ID, "input-password")
+    SUBMIT = Element(By.CSS_SELECTOR, "button[type='submit']")
 
     def open_admin(self, base_url, admin_path):
         return self.open(base_url + admin_path)
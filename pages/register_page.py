@@ -1,49 +1,27 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from pages.base import BasePage
+from pages.base import BasePage, Element
+from utils.budget import budget
 
 class RegisterPage(BasePage):
-    FIRSTNAME = (By.CSS_SELECTOR, "#input-firstname")
-    LASTNAME  = (By.CSS_SELECTOR, "#input-lastname")
-    EMAIL     = (By.CSS_SELECTOR, "#input-email")
+    FIRSTNAME = Element(By.CSS_SELECTOR, "#input-firstname")
+    LASTNAME  = Element(By.CSS_SELECTOR, "#input-lastname")
+    EMAIL     = Element(By.CSS_SELECTOR, "#input-email")
     TELEPHONE = (By.CSS_SELECTOR, "#input-telephone")
-    PASSWORD  = (By.CSS_SELECTOR, "#input-password")
+    CONFIRM   = (By.CSS_SELECTOR, "#input-confirm, input[name='confirm']")
+    # темы без id/name у подтверждения: второе поле пароля (где оно и есть CONFIRM, значение то же)
+    SECOND_PASSWORD = (By.XPATH, "(//input[@type='password'])[2]")
+    PASSWORD  = Element(By.CSS_SELECTOR, "#input-password")
 
     AGREE     = (By.NAME, "agree")
     AGREE_LABEL = (By.CSS_SELECTOR, "label[for='input-agree'], label[for='agree'], #agree + label")
-    SUBMIT    = (By.CSS_SELECTOR, "input[type='submit'], button[type='submit']")
+    SUBMIT    = Element(By.CSS_SELECTOR, "input[type='submit'], button[type='submit']")
     SUCCESS_HEADING = (By.CSS_SELECTOR, "#content h1")
 
     def open_register(self, base_url):
         return self.open(base_url + "/index.php?route=account/register")
 
-    def _type_if_present(self, locator, text) -> bool:
-        els = self.driver.find_elements(*locator)
-        if els:
-            el = els[0]
-            el.clear()
-            el.send_keys(text)
-            return True
-        return False
-
-    def _type_confirm_password(self, password: str):
-
-        for locator in [(By.CSS_SELECTOR, "#input-confirm"), (By.NAME, "confirm")]:
-            if self._type_if_present(locator, password):
-                return
-
-        pw_fields = self.driver.find_elements(By.CSS_SELECTOR, "input[type='password']")
-        if len(pw_fields) >= 2:
-            try:
-                el = pw_fields[1]
-                el.clear()
-                el.send_keys(password)
-                return
-            except Exception:
-                pass
-
-
     def _ensure_agree_checked(self):
 
         inputs = self.driver.find_elements(*self.AGREE)
@@ -61,39 +39,28 @@ class RegisterPage(BasePage):
                     self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", labels[0])
                     self.driver.execute_script("arguments[0].click();", labels[0])
 
-    def _wait_success_or_errors(self, timeout: int = 8):
-        wait = WebDriverWait(self.driver, timeout)
-
-        try:
-            wait.until(lambda d: "success" in (d.current_url or "").lower()
-                                 or "Your Account Has Been Created" in (d.title or "")
-                                 or "Your Account Has Been Created" in (d.find_element(*self.SUCCESS_HEADING).text or ""))
-            return True
-        except Exception:
-            return False
-
     def register(self, firstname, lastname, email, password):
-        self.type(self.FIRSTNAME, firstname)
-        self.type(self.LASTNAME,  lastname)
-        self.type(self.EMAIL,     email)
-        self._type_if_present(self.TELEPHONE, "0123456789")
-        self.type(self.PASSWORD,  password)
-        self._type_confirm_password(password)
+        # форма должна отрисоваться, дальше все поля заполняются одним скриптом
+        self.wait_visible(RegisterPage.FIRSTNAME)
+        self.fill_form({
+            RegisterPage.FIRSTNAME: firstname,
+            RegisterPage.LASTNAME:  lastname,
+            RegisterPage.EMAIL:     email,
+            RegisterPage.TELEPHONE: "0123456789",
+            RegisterPage.PASSWORD:  password,
+            RegisterPage.CONFIRM:   password,
+            RegisterPage.SECOND_PASSWORD: password,
+        }, optional=(RegisterPage.TELEPHONE, RegisterPage.CONFIRM, RegisterPage.SECOND_PASSWORD))
         self._ensure_agree_checked()
-        self.click(self.SUBMIT)
-
-        if self._wait_success_or_errors(timeout=10):
-            return WebDriverWait(self.driver, 5).until(EC.visibility_of_element_located(self.SUCCESS_HEADING))
-
 
-        error_selectors = [
-            ".text-danger", ".invalid-feedback", ".alert-danger", ".alert-warning"
-        ]
-        messages = []
-        for css in error_selectors:
-            for el in self.driver.find_elements(By.CSS_SELECTOR, css):
-                txt = (el.text or "").strip()
-                if txt:
-                    messages.append(txt)
-        msg = "; ".join(messages)
-        raise AssertionError(f"Регистрация не завершилась успехом. Заголовок='{(self.driver.find_element(*self.SUCCESS_HEADING).text if self.driver.find_elements(*self.SUCCESS_HEADING) else 'N/A')}'. Ошибки: {msg or 'не найдены'}")
+        # успех, ошибки у полей или предупреждение — что появится раньше, без ожидания таймаута
+        verdict = self.submit(RegisterPage.SUBMIT,
+                              success_urls=("account/success",),
+                              success_texts=((self.SUCCESS_HEADING[1], "Your Account Has Been Created"),),
+                              timeout=10)
+        if verdict["ok"]:
+            return WebDriverWait(self.driver, budget.timeout(5)).until(EC.visibility_of_element_located(self.SUCCESS_HEADING))
+
+        raise AssertionError(f"Регистрация не завершилась успехом ({verdict['state']}). "
+                             f"Заголовок='{verdict['heading'] or 'N/A'}'. "
+                             f"Ошибки: {'; '.join(verdict['messages']) or 'не найдены'}")
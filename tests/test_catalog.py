@@ -1,6 +1,9 @@
+import pytest
 from selenium.webdriver.common.by import By
 from utils.waits import wait_element, wait_all
 
+@pytest.mark.static
+@pytest.mark.visit("/index.php?route=product/category&path=20")
 def test_catalog_page(browser, base_url):
     # Пример: Desktops (path=20)
     browser.get(base_url + "/index.php?route=product/category&path=20")
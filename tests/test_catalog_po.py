@@ -1,5 +1,8 @@
+import pytest
 from pages.category_page import CategoryPage
 
+@pytest.mark.static
+@pytest.mark.visit("/index.php?route=product/category&path=20")
 def test_catalog_page_po(browser, base_url):
     page = CategoryPage(browser).open_by_path(base_url, "20")
     page.wait_visible(CategoryPage.BREADCRUMB)
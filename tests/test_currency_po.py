@@ -1,8 +1,9 @@
 import pytest
 from pages.components.currency_dropdown import CurrencyDropdown
-from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import WebDriverException
+from utils import probe
 
+@pytest.mark.visit("/", mutating=True)
 @pytest.mark.parametrize("currency_name,currency_symbol", [
     ("€ Euro", "€"),
     ("£ Pound Sterling", "£"),
@@ -13,13 +14,10 @@ def test_currency_switch_po(browser, base_url, wait, currency_name, currency_sym
     dropdown.choose_currency(currency_name)
 
     def has_symbol(driver):
-        elems = driver.find_elements(By.CSS_SELECTOR, ".product-thumb .price, .price")
-        for e in elems:
-            try:
-                if currency_symbol in ((e.text or "").strip()):
-                    return True
-            except StaleElementReferenceException:
-                continue
-        return False
+        try:
+            return any(currency_symbol in txt for txt in probe.price_texts(driver, "body"))
+        except WebDriverException:
+            # страница ещё перегружается после смены валюты
+            return False
 
     wait.until(has_symbol)
@@ -1,5 +1,8 @@
+import pytest
 from utils.waits import wait_element, wait_all, wait_title
 
+@pytest.mark.static
+@pytest.mark.visit("/")
 def test_main_page_elements(browser, base_url):
     browser.get(base_url)
 
@@ -1,5 +1,8 @@
+import pytest
 from pages.main_page import MainPage
 
+@pytest.mark.static
+@pytest.mark.visit("/")
 def test_main_page_elements_po(browser, base_url):
     page = MainPage(browser).open_home(base_url)
     page.wait_visible(MainPage.LOGO)
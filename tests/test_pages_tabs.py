@@ -0,0 +1,31 @@
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.main_page import MainPage
+from pages.category_page import CategoryPage
+from pages.product_page import ProductPage
+from pages.register_page import RegisterPage
+
+
+def _all_visible(*locators):
+    def _condition(driver):
+        return all(EC.visibility_of_element_located(loc)(driver) for loc in locators)
+    return _condition
+
+
+def test_read_only_pages_in_tabs(tab_runner, base_url):
+    results = tab_runner.run([
+        ("main", base_url + "/",
+         _all_visible(MainPage.LOGO, MainPage.SEARCH, MainPage.CART, MainPage.PRODUCT_TILES)),
+        ("category", base_url + "/index.php?route=product/category&path=20",
+         _all_visible(CategoryPage.BREADCRUMB, CategoryPage.LEFT_MENU, CategoryPage.SORT,
+                      CategoryPage.LIMIT, CategoryPage.PRODUCT_TILES)),
+        ("product", base_url + "/index.php?route=product/product&path=57&product_id=49",
+         _all_visible(ProductPage.TITLE_H1, ProductPage.BUTTON_CART, ProductPage.QTY,
+                      ProductPage.TABS, ProductPage.PRICE_BLOCK)),
+        ("register", base_url + "/index.php?route=account/register",
+         _all_visible(RegisterPage.FIRSTNAME, RegisterPage.LASTNAME, RegisterPage.EMAIL,
+                      RegisterPage.PASSWORD, RegisterPage.AGREE, RegisterPage.SUBMIT)),
+    ])
+
+    failed = {name: r["error"] for name, r in results.items() if not r["ok"]}
+    assert not failed, f"Проверки во вкладках не прошли: {failed}"
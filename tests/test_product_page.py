@@ -1,6 +1,9 @@
+import pytest
 from selenium.webdriver.common.by import By
 from utils.waits import wait_element, wait_all
 
+@pytest.mark.static
+@pytest.mark.visit("/index.php?route=product/product&path=57&product_id=49")
 def test_product_page(browser, base_url):
 
     browser.get(base_url + "/index.php?route=product/product&path=57&product_id=49")
@@ -1,5 +1,8 @@
+import pytest
 from pages.product_page import ProductPage
 
+@pytest.mark.static
+@pytest.mark.visit("/index.php?route=product/product&path=57&product_id=49")
 def test_product_page_po(browser, base_url):
     page = ProductPage(browser).open_by_id(base_url, path="57", product_id="49")
     page.wait_visible(ProductPage.TITLE_H1)
@@ -1,6 +1,9 @@
+import pytest
 from selenium.webdriver.common.by import By
 from utils.waits import wait_element
 
+@pytest.mark.static
+@pytest.mark.visit("/index.php?route=account/register")
 def test_register_page(browser, base_url):
     browser.get(base_url + "/index.php?route=account/register")
     wait_element(browser, "#content h1")
@@ -13,6 +13,10 @@ from selenium.common.exceptions import TimeoutException, StaleElementReferenceEx
 from datetime import date, datetime
 from selenium.webdriver.common.keys import Keys
 
+from utils import probe
+from utils.breaker import ADMIN_LOGIN_FAILED
+from utils.waits import BudgetWait
+
 # Настройка логгера для отладки
 logger = logging.getLogger(__name__)
 
@@ -31,28 +35,11 @@ def _safe_click(driver, el):
 
 def _get_cart_indicator_text(driver) -> str:
     """Возвращает текст из индикатора корзины (разные темы OpenCart)."""
-    candidates = [
-        (By.CSS_SELECTOR, "#cart-total"),
-        (By.CSS_SELECTOR, "#cart .dropdown-toggle"),
-        (By.CSS_SELECTOR, "#header-cart .dropdown-toggle"),
-        (By.CSS_SELECTOR, "#cart > button"),
-    ]
-    for by, sel in candidates:
-        els = driver.find_elements(by, sel)
-        if els:
-            try:
-                txt = (els[0].text or "").strip()
-                if txt:
-                    return txt
-
-            except (StaleElementReferenceException, NoSuchElementException) as e:
-                logger.warning(f"Failed to get text from cart indicator '{sel}': {e}")
-            except WebDriverException as e:
-                logger.error(f"WebDriver error getting cart indicator text: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error getting cart indicator text: {e}")
-
-    return ""
+    try:
+        return probe.cart_text(driver)
+    except WebDriverException as e:
+        logger.error(f"WebDriver error getting cart indicator text: {e}")
+        return ""
 
 
 def _get_cart_count(driver) -> int:
@@ -90,39 +77,16 @@ def _wait_price_has_symbol(wait: WebDriverWait, css_scope: str, symbol: str):
     """Ждём, пока цены на странице обновятся и содержат нужный символ валюты."""
     def _probe(driver):
         try:
-            elems = driver.find_elements(
-                By.CSS_SELECTOR,
-                f"{css_scope} .price, {css_scope} .product-thumb .price"
-            )
-
-            if not elems:
-                return False
-            for e in elems:
-                try:
-                    txt = (e.text or "").strip()
-                    if symbol in txt:
-                        return True
-                except StaleElementReferenceException:
-                    logger.debug("Element became stale while checking price symbol")
-                    return False
-            return False
-        except StaleElementReferenceException:
-            logger.debug("Elements became stale while finding prices")
-            return False
-        except (NoSuchElementException, WebDriverException) as e:
-            logger.warning(f"Error finding price elements: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error checking price symbols: {e}")
-
+            # все цены области одним запросом, а не .text на каждый элемент
+            return any(symbol in txt for txt in probe.price_texts(driver, css_scope))
+        except WebDriverException as e:
+            # страница перегружается после смены валюты — просто ждём следующего опроса
+            logger.debug(f"Error reading prices: {e}")
             return False
 
     wait.until(_probe)
 
 
-
-
-
 def _detect_product_type_and_requirements(driver):
     """
     Определяет тип товара на странице и возвращает информацию о требуемых полях.
@@ -324,7 +288,7 @@ from selenium.webdriver.common.by import By
 
 def _wait_add_to_cart_feedback(driver, base_count: int, timeout: int = 12):
     """Ждём подтверждение: рост счётчика, alert-success или наличие строк в мини-корзине."""
-    w = WebDriverWait(driver, timeout)
+    w = BudgetWait(driver, timeout)
     
     def _ok(d):
         # Проверяем рост счетчика корзины
@@ -382,6 +346,29 @@ def _wait_add_to_cart_feedback(driver, base_count: int, timeout: int = 12):
 
 
 
+def _discover_product_hrefs(browser, wait, base_url):
+    """Запасной путь: собирает ссылки на товары с главной или из категории."""
+    browser.get(base_url + "/")
+
+    wait.until(EC.visibility_of_any_elements_located((
+        By.CSS_SELECTOR,
+        ".product-thumb, .product-layout, .product-grid, .product-list, .product"
+    )))
+
+    def collect_product_hrefs(scope_css=""):
+        return probe.product_links(browser, scope_css.strip())
+
+    hrefs = collect_product_hrefs("")
+    if not hrefs:
+        browser.get(base_url + "/index.php?route=product/category&path=20")
+        wait.until(EC.visibility_of_any_elements_located((
+            By.CSS_SELECTOR, ".product-thumb, .product-layout, .product-grid, .product-list, .product"
+        )))
+        hrefs = collect_product_hrefs("#content ")
+
+    return random.sample(hrefs, k=min(3, len(hrefs)))
+
+
 # ==================== tests ====================
 
 # 3.1 Логин–разлогин в админку
@@ -398,7 +385,8 @@ def test_admin_login_logout(browser, wait, base_url, admin_path, admin_creds):
 
 
     # Ждём появления главного меню админки - это самый надёжный индикатор успешного входа
-    wait.until(EC.visibility_of_element_located((By.ID, "menu")))
+    wait.until(EC.visibility_of_element_located((By.ID, "menu")),
+               message=f"{ADMIN_LOGIN_FAILED}: главное меню не появилось")
     logger.debug("Успешно вошли в админ-панель - главное меню видимо")
 
 
@@ -409,44 +397,13 @@ def test_admin_login_logout(browser, wait, base_url, admin_path, admin_creds):
 
 
 # 3.2 Добавление случайного товара в корзину (через страницу товара)
-def test_add_random_product_to_cart(browser, wait, base_url):
-    browser.get(base_url + "/")
-
-    wait.until(EC.visibility_of_any_elements_located((
-        By.CSS_SELECTOR,
-        ".product-thumb, .product-layout, .product-grid, .product-list, .product"
-    )))
-
-    def collect_product_hrefs(scope_css=""):
-        selectors = [
-            f"{scope_css} a[href*='product_id=']",
-            f"{scope_css} a[href*='route=product/product']",
-            f"{scope_css} .caption h4 a",
-            f"{scope_css} .product-thumb a",
-            f"{scope_css} .product-layout a",
-        ]
-        hrefs = []
-        for sel in selectors:
-            for a in browser.find_elements(By.CSS_SELECTOR, sel):
-                try:
-                    href = a.get_attribute("href") or ""
-                    if "product_id=" in href or "route=product/product" in href:
-                        hrefs.append(href)
-                except (StaleElementReferenceException, NoSuchElementException) as e:
-                    logger.warning(f"Failed to get href from element with selector '{sel}': {e}")
-                except WebDriverException as e:
-                    logger.error(f"WebDriver error getting href from element: {e}")
-                except Exception as e:
-                    logger.error(f"Unexpected error getting href: {e}")
-        return list(dict.fromkeys(hrefs))
-
-    hrefs = collect_product_hrefs("")
+def test_add_random_product_to_cart(browser, wait, base_url, catalog):
+    # Товары без обязательных опций берём из индекса каталога — без скрапинга и повторов
+    eligible = catalog.random_products(k=3, required_options=False)
+    hrefs = [catalog.product_url(p["id"]) for p in eligible]
     if not hrefs:
-        browser.get(base_url + "/index.php?route=product/category&path=20")
-        wait.until(EC.visibility_of_any_elements_located((
-            By.CSS_SELECTOR, ".product-thumb, .product-layout, .product-grid, .product-list, .product"
-        )))
-        hrefs = collect_product_hrefs("#content ")
+        logger.info("Индекс каталога пуст — ищем товары на страницах витрины")
+        hrefs = _discover_product_hrefs(browser, wait, base_url)
 
     assert hrefs, "Не нашли ссылок на товары ни на главной, ни в категории"
 
@@ -454,7 +411,7 @@ def test_add_random_product_to_cart(browser, wait, base_url):
     success = False
     errors = []
 
-    for product_link_href in random.sample(hrefs, k=min(3, len(hrefs))):
+    for product_link_href in hrefs[:3]:
         browser.get(product_link_href)
         _fill_required_options_if_has_fields(browser)
 
@@ -480,8 +437,8 @@ def test_add_random_product_to_cart(browser, wait, base_url):
     assert success, f"Не удалось добавить товар в корзину. Детали: {errors}"
 
 
-
 # 3.3 Переключение валют на главной
+@pytest.mark.visit("/", mutating=True)
 @pytest.mark.parametrize("currency_name,currency_symbol", [
     ("€ Euro", "€"),
     ("£ Pound Sterling", "£"),
@@ -498,6 +455,7 @@ def test_currency_switch_on_main(browser, wait, base_url, currency_name, currenc
 
 
 # 3.4 Переключение валют в каталоге
+@pytest.mark.visit("/index.php?route=product/category&path=20", mutating=True)
 @pytest.mark.parametrize("currency_name,currency_symbol", [
     ("€ Euro", "€"),
     ("£ Pound Sterling", "£"),
@@ -0,0 +1,36 @@
+import pytest
+
+from pages.admin.admin_products_page import AdminProductsPage
+from pages.admin.admin_routes import AdminRouter
+
+pytestmark = pytest.mark.unit
+
+
+class _Driver:
+    def __init__(self, url):
+        self.current_url = url
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+
+def test_router_from_current_admin_url():
+    driver = _Driver("http://shop/admin_x/index.php?route=common/dashboard&user_token=abc")
+    router = AdminRouter.from_current_url(driver)
+    assert router.url("product_form", product_id=42) == \
+        "http://shop/admin_x/index.php?route=catalog%2Fproduct.form&user_token=abc&product_id=42"
+
+
+def test_open_product_form_without_open_products_uses_current_page():
+    page = AdminProductsPage(_Driver("http://shop/administration/index.php?route=common/dashboard&user_token=t"))
+    page.open_product_form()
+    assert page.driver.visited == [
+        "http://shop/administration/index.php?route=catalog%2Fproduct.form&user_token=t"]
+
+
+def test_open_product_form_before_login_explains_what_to_do():
+    page = AdminProductsPage(_Driver("about:blank"))
+    with pytest.raises(RuntimeError, match="open_products"):
+        page.open_product_form()
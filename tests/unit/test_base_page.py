@@ -0,0 +1,86 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base import BasePage, Element
+
+pytestmark = pytest.mark.unit
+
+
+class _Node:
+    def __init__(self, element_id, displayed=True):
+        self.id = element_id
+        self.displayed = displayed
+        self.typed = None
+
+    def clear(self):
+        self.typed = ""
+
+    def send_keys(self, text):
+        self.typed = text
+
+    def is_displayed(self):
+        return self.displayed
+
+
+class _Driver:
+    """Знает только элементы из словаря locator -> _Node и считает поиски."""
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.lookups = []
+
+    def execute_script(self, script, bulk):
+        self.bulk = bulk
+        return []
+
+    def find_element(self, by, value):
+        self.lookups.append((by, value))
+        if (by, value) not in self.nodes:
+            raise NoSuchElementException(value)
+        return self.nodes[(by, value)]
+
+
+class _Page(BasePage):
+    LOGO = Element(By.ID, "logo")
+    HIDDEN = Element(By.ID, "menu")
+    MISSING = Element(By.ID, "missing")
+
+
+@pytest.fixture
+def page():
+    return _Page(_Driver({(By.ID, "logo"): _Node("1"), (By.ID, "menu"): _Node("2", displayed=False)}))
+
+
+def test_element_attribute_is_a_locator_on_class_and_instance(page):
+    assert _Page.LOGO == (By.ID, "logo")
+    assert page.LOGO == (By.ID, "logo")
+    assert page.MISSING[1] == "missing"
+    assert page.driver.lookups == []
+
+
+def test_element_is_resolved_once_and_cached(page):
+    first = page.element(page.LOGO)
+    assert page.element(page.LOGO) is first
+    assert page.cache_stats == {"hits": 1, "misses": 1, "stale": 0}
+    page.forget_elements()
+    page.element(page.LOGO)
+    assert page.cache_stats["misses"] == 2
+
+
+@pytest.mark.parametrize("name", ["HIDDEN", "MISSING"])
+def test_wait_visible_uses_callers_timeout(page, name):
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        page.wait_visible(getattr(page, name), timeout=0.2)
+    assert time.monotonic() - started < 2
+
+
+def test_fill_form_types_fields_with_unknown_strategy(page):
+    custom = ("-custom-", "logo")
+    page.driver.nodes[custom] = _Node("3")
+    page.fill_form({(By.LINK_TEXT, "Login"): "a", (By.TAG_NAME, "textarea"): "b", custom: "c"})
+    assert page.driver.bulk == [("link text", "Login", "a"), ("tag name", "textarea", "b")]
+    assert page.driver.nodes[custom].typed == "c"
@@ -0,0 +1,98 @@
+import pytest
+
+from utils.breaker import CircuitBreaker
+
+pytestmark = pytest.mark.unit
+
+
+class _Config:
+    options = {"--breaker-threshold": 3, "--base-url": "http://localhost", "--no-breaker": False,
+               "--no-preflight": True, "--test-budget": 0, "--run-budget": 0}
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+class _Crash:
+    def __init__(self, message):
+        self.message = message
+        self.path = "tests/test_x.py"
+        self.lineno = 10
+
+
+class _Longrepr:
+    def __init__(self, message):
+        self.reprcrash = _Crash(message)
+
+
+class _Report:
+    def __init__(self, nodeid, message, when="call"):
+        self.nodeid = nodeid
+        self.longrepr = _Longrepr(message)
+        self.failed = True
+        self.when = when
+
+
+TIMEOUT = "selenium.common.exceptions.TimeoutException: Message: Не дождался элемента ('css selector', '#logo')"
+
+
+class _Item:
+    def __init__(self, nodeid, *markers):
+        self.nodeid = nodeid
+        self.markers = markers
+
+    def get_closest_marker(self, name):
+        return name if name in self.markers else None
+
+
+def test_repeated_wait_timeout_trips_only_its_modules():
+    breaker = CircuitBreaker(_Config())
+    for nodeid in ("tests/test_x.py::test_a", "tests/test_x.py::test_b", "tests/test_y.py::test_c"):
+        breaker.pytest_runtest_logreport(_Report(nodeid, TIMEOUT))
+    assert set(breaker.tripped) == {"module:tests/test_x.py", "module:tests/test_y.py"}
+    assert breaker._reason_for(_Item("tests/test_x.py::test_d"))
+    assert breaker._reason_for(_Item("tests/test_admin.py::test_add", "admin")) is None
+    # то же падение в новом модуле останавливает и его
+    breaker.pytest_runtest_logreport(_Report("tests/test_z.py::test_e", TIMEOUT))
+    assert breaker._reason_for(_Item("tests/test_z.py::test_f"))
+
+
+def test_plain_assertion_does_not_trip():
+    breaker = CircuitBreaker(_Config())
+    for name in ("a", "b", "c", "d"):
+        breaker.pytest_runtest_logreport(_Report(f"tests/test_x.py::test_{name}", "AssertionError: assert 1 == 2"))
+    assert not breaker.tripped
+
+
+def test_parametrized_cases_count_once():
+    breaker = CircuitBreaker(_Config())
+    for case in ("€", "£", "$"):
+        breaker.pytest_runtest_logreport(_Report(f"tests/test_x.py::test_currency[{case}]", TIMEOUT))
+    assert not breaker.tripped
+
+
+def test_connection_error_trips_immediately():
+    breaker = CircuitBreaker(_Config())
+    breaker.pytest_runtest_logreport(
+        _Report("tests/test_x.py::test_a", "WebDriverException: Message: unknown error: net::ERR_CONNECTION_REFUSED"))
+    assert "all" in breaker.tripped
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _Session:
+    def __init__(self, *items):
+        self.items = list(items)
+        self.config = type("C", (), {"option": type("O", (), {"collectonly": False})()})()
+
+
+@pytest.mark.parametrize("status, tripped", [(200, False), (302, False), (404, True), (503, True)])
+def test_preflight_checks_status(monkeypatch, status, tripped):
+    monkeypatch.setattr("utils.breaker.requests.get", lambda url, timeout: _Response(status))
+    breaker = CircuitBreaker(_Config())
+    breaker.preflight = True
+    breaker.pytest_collection_finish(_Session(_Item("tests/test_x.py::test_a")))
+    assert ("all" in breaker.tripped) is tripped
@@ -0,0 +1,123 @@
+import pytest
+
+from utils.catalog import Catalog, _LinkParser, _ProductParser, parse_price
+
+pytestmark = pytest.mark.unit
+
+BASE = "http://shop"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$1,202.00", 1202.0),
+    ("1.202,00€", 1202.0),
+    ("£80.00", 80.0),
+    ("12,5€", 12.5),
+    ("12,50 €", 12.5),
+    ("1,202$", 1202.0),
+    ("1,234,567$", 1234567.0),
+    ("Ex Tax: $98.00", 98.0),
+    ("Нет в наличии", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_price(text, expected):
+    assert parse_price(text) == expected
+
+
+def test_link_parser_collects_categories_and_products():
+    parser = _LinkParser(BASE + "/index.php?route=common/home")
+    parser.feed("""
+        <a href="/index.php?route=product/category&amp;language=en-gb&amp;path=20">Desktops</a>
+        <a href="index.php?route=product/category&path=20_27">Mac</a>
+        <a href="/index.php?route=product/product&amp;product_id=40">iPhone</a>
+        <a href="/index.php?route=product/product&product_id=abc">сломанная</a>
+        <a href="/index.php?route=product/category">без path</a>
+        <div href="/index.php?route=product/product&product_id=41">не ссылка</div>
+    """)
+    assert parser.categories == {"20", "20_27"}
+    assert parser.products == {"40"}
+
+
+def test_product_parser_reads_name_price_and_required_options():
+    parser = _ProductParser()
+    parser.feed("""
+        <h1>Apple Cinema 30"</h1>
+        <ul><li><span class="price-old">$122.00</span></li>
+            <li><h2><span class="price-new">$110.00</span></h2></li></ul>
+        <div class="mb-3 required">
+          <label>Radio</label>
+          <div id="input-option-218">
+            <input type="radio" name="option[218]" value="5">
+            <input type="radio" name="option[218]" value="6">
+          </div>
+        </div>
+        <div class="mb-3 required"><select name="option[217]"></select></div>
+        <div class="mb-3"><input type="text" name="option[208]"></div>
+        <h1>второй заголовок</h1>
+        <div class="price">$1.00</div>
+    """)
+    assert parser.name == 'Apple Cinema 30"'
+    assert parser.price == 110.0
+    assert parser.required_options == {"218": "radio", "217": "select"}
+
+
+@pytest.mark.parametrize("html, expected", [
+    # посторонний h2 с суммой раньше цены товара
+    ('<h2>Free shipping over $50</h2><ul><li><span class="price-new">$98.00</span></li></ul>', 98.0),
+    # старая цена и цены похожих товаров не мешают
+    ('<span class="price-old">$122.00</span><h2><span class="price-new">$98.00</span></h2>'
+     '<div class="price"><span class="price-new">$5.00</span></div>', 98.0),
+    ('<div class="product-info"><p class="price">£80.00</p></div><h2>Reviews</h2>', 80.0),
+    # тема без классов цены — остаётся h2
+    ("<h2>Related</h2><h2>1.202,00€</h2>", 1202.0),
+    ('<h2 class="price">$7.00</h2>', 7.0),
+])
+def test_product_parser_prefers_price_classes_over_h2(html, expected):
+    parser = _ProductParser()
+    parser.feed(html)
+    assert parser.price == expected
+
+
+def test_product_parser_without_price_or_options():
+    parser = _ProductParser()
+    parser.feed("<h1>iPhone</h1><p>Нет цены</p>")
+    assert (parser.name, parser.price, parser.required_options) == ("iPhone", None, {})
+
+
+def _product(pid, categories, price, options=None):
+    return {"id": pid, "name": f"p{pid}", "categories": categories, "price": price,
+            "required_options": options or {}}
+
+
+@pytest.fixture
+def catalog():
+    return Catalog(BASE + "/", {
+        "40": _product("40", ["24"], 123.2),
+        "42": _product("42", ["20", "20_27"], 110.0, {"218": "radio"}),
+        "43": _product("43", ["18_46"], 602.0),
+        "44": _product("44", ["20"], None),
+    })
+
+
+@pytest.mark.parametrize("filters, expected", [
+    ({}, {"40", "42", "43", "44"}),
+    ({"category": 20}, {"42", "44"}),
+    ({"category": "27"}, {"42"}),
+    ({"category": "46"}, {"43"}),
+    ({"category": "2"}, set()),
+    ({"required_options": True}, {"42"}),
+    ({"required_options": False}, {"40", "43", "44"}),
+    ({"min_price": 120}, {"40", "43"}),
+    ({"max_price": 200}, {"40", "42"}),
+    ({"category": 20, "required_options": False}, {"44"}),
+    ({"min_price": 100, "max_price": 150, "required_options": False}, {"40"}),
+])
+def test_catalog_query(catalog, filters, expected):
+    assert {p["id"] for p in catalog.query(**filters)} == expected
+
+
+def test_catalog_round_trip(catalog):
+    restored = Catalog.from_dict(catalog.to_dict())
+    assert restored.base_url == BASE
+    assert restored.products == catalog.products
+    assert restored.product_url("40") == BASE + "/index.php?route=product/product&product_id=40"
@@ -0,0 +1,50 @@
+import pytest
+
+from utils import impact
+from utils.impact import ImpactPlugin
+
+pytestmark = pytest.mark.unit
+
+
+class _Item:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+def _plugin():
+    plugin = ImpactPlugin.__new__(ImpactPlugin)
+    plugin.root = "."
+    return plugin
+
+
+def _select(monkeypatch, tests, changes):
+    monkeypatch.setattr(impact, "changed_files", lambda root, commit: changes.get(commit))
+    items = [_Item(nodeid) for nodeid in tests] + [_Item("tests/test_new.py::test_new")]
+    selected, _ = _plugin()._affected(items, {"commit": "new", "tests": tests})
+    return [item.nodeid for item in selected]
+
+
+def test_each_entry_is_diffed_against_its_own_commit(monkeypatch):
+    tests = {
+        "tests/test_a.py::test_a": {"files": ["pages/main_page.py"], "commit": "new"},
+        # записан раньше: изменение main_page.py между old и new его касается
+        "tests/test_b.py::test_b": {"files": ["pages/main_page.py"], "commit": "old"},
+    }
+    changes = {"new": set(), "old": {"pages/main_page.py"}}
+    assert _select(monkeypatch, tests, changes) == ["tests/test_b.py::test_b", "tests/test_new.py::test_new"]
+
+
+def test_global_file_or_unknown_commit_selects_entry(monkeypatch):
+    tests = {
+        "tests/test_a.py::test_a": {"files": ["utils/waits.py"], "commit": "c1"},
+        "tests/test_b.py::test_b": {"files": ["utils/waits.py"], "commit": "gone"},
+        "tests/test_c.py::test_c": {"files": ["utils/waits.py"], "commit": "c2"},
+    }
+    changes = {"c1": {"conftest.py"}, "c2": {"pages/main_page.py"}}
+    assert _select(monkeypatch, tests, changes) == [
+        "tests/test_a.py::test_a", "tests/test_b.py::test_b", "tests/test_new.py::test_new"]
+
+
+def test_changed_test_file_selects_its_tests(monkeypatch):
+    tests = {"tests/test_a.py::test_a": {"files": [], "commit": "c1"}}
+    assert _select(monkeypatch, tests, {"c1": {"tests/test_a.py"}})[0] == "tests/test_a.py::test_a"
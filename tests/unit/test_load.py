@@ -0,0 +1,24 @@
+import pytest
+
+from utils.load import Stats, VirtualUser
+
+pytestmark = pytest.mark.unit
+
+
+def test_virtual_user_requires_iteration():
+    with pytest.raises(TypeError):
+        VirtualUser(0, "http://shop", None, Stats())
+
+
+def test_step_records_time_and_errors():
+    class User(VirtualUser):
+        def iteration(self):
+            self.step("home", lambda: None)
+            self.step("add_to_cart", lambda: 1 / 0)
+
+    stats = Stats()
+    User(0, "http://shop", None, stats, think=0).iteration()
+    steps = stats.report()["steps"]
+    assert steps["home"]["error_rate"] == 0
+    assert steps["add_to_cart"]["error_rate"] == 1
+    assert "ZeroDivisionError" in next(iter(steps["add_to_cart"]["errors"]))
@@ -0,0 +1,74 @@
+import pytest
+from selenium.webdriver.common.by import By
+
+from utils import locator_profiler
+from utils.locator_profiler import xpath_to_css
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("xpath, expected", [
+    ("//button", ("button", False)),
+    ("//*", ("*", False)),
+    ("//div[@id='content']", ("#content", False)),
+    ("//*[@id='content']", ("#content", False)),
+    ("//input[@name='email']", ("input[name='email']", False)),
+    ("//div[@class='alert'][@id='x']", ("#x[class='alert']", False)),
+    ("//a[contains(@href, 'route=checkout')]", ("a[href*='route=checkout']", False)),
+    ("//div[@id='x']/div[@id='y'][@name='z']", ("#x > #y[name='z']", False)),
+    ("//ul//li/a", ("ul li > a", False)),
+    ("/html/body", ("html > body", False)),
+    ("//form[@id='form-currency']//a[contains(normalize-space(.), '')]", ("#form-currency a", True)),
+    ("//button[text()='Login']", ("button", True)),
+    ("//div[@id='form.currency']", ("div[id='form.currency']", False)),
+    ("//*[@id='1col']", ("[id='1col']", False)),
+])
+def test_xpath_to_css(xpath, expected):
+    assert xpath_to_css(xpath) == expected
+
+
+@pytest.mark.parametrize("xpath", [
+    "//li[1]",
+    "//a[contains(., 'Cart')]",
+    "//a/..",
+    "//a | //button",
+    "(//a)[2]",
+    "//input[@type=\"text\"]",
+    "//div/following-sibling::span",
+    "",
+])
+def test_xpath_to_css_untranslatable(xpath):
+    assert xpath_to_css(xpath) is None
+
+
+class _Driver:
+    """PROFILE_JS: по одному совпадению; VERIFY_JS: замена не совпала на странице mismatch."""
+
+    def __init__(self, mismatch=None):
+        self.mismatch = mismatch
+        self.url = None
+
+    def get(self, url):
+        self.url = url
+
+    def execute_script(self, script, payload, *args):
+        if script == locator_profiler.VERIFY_JS:
+            bad = self.mismatch and self.url.endswith(locator_profiler.PAGES[self.mismatch])
+            return [{"ok": not bad, "original": 1, "candidate": 2 if bad else 1, "error": None} for _ in payload]
+        return [{"count": 1, "ms": 0.01, "error": None, "scope": None, "branches": None} for _ in payload]
+
+
+def _xpath_locator():
+    return {"by": By.XPATH, "value": "//div[@id='content']", "single": True}
+
+
+def test_profile_suggests_only_verified_replacement():
+    [loc] = locator_profiler.profile(_Driver(), "http://shop", [_xpath_locator()], runs=1)
+    assert loc["suggestion"] == "CSS '#content'"
+    assert "rejected" not in loc
+
+
+def test_profile_rejects_replacement_matching_other_elements():
+    [loc] = locator_profiler.profile(_Driver(mismatch="register"), "http://shop", [_xpath_locator()], runs=1)
+    assert loc["suggestion"] is None
+    assert "register (1 -> 2)" in loc["rejected"]
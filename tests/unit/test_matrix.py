@@ -0,0 +1,52 @@
+import pytest
+
+from utils.matrix import BrowserMatrix, leg_args, split_browsers
+
+pytestmark = pytest.mark.unit
+
+LEG_TAIL = "--browser={b} --junitxml=leg.xml --cache-dir=c/{b} --cleanup-prefix="
+
+
+def test_split_browsers():
+    assert split_browsers("Chrome, firefox,,chrome") == ["chrome", "firefox"]
+
+
+@pytest.mark.parametrize("args", [
+    ["--browser", "chrome,firefox", "-q"],
+    ["--browser=chrome,firefox", "-q"],
+    ["--junitxml", "out.xml", "--browser", "chrome,firefox", "-q"],
+    ["--junit-xml=out.xml", "-q", "--browser=chrome,firefox"],
+])
+def test_per_leg_options_replaced(args):
+    assert leg_args(args, "firefox", "leg.xml", "c/firefox") == ["-q", *LEG_TAIL.format(b="firefox").split()]
+
+
+def test_timing_is_a_flag_and_output_is_per_leg():
+    args = ["--timing", "tests/test_a.py", "--timing-out", "out/t", "-q"]
+    assert leg_args(args, "chrome", "leg.xml", "c/chrome", "out/t-chrome") == \
+        ["--timing", "tests/test_a.py", "-q", *LEG_TAIL.format(b="chrome").split(), "--timing-out=out/t-chrome"]
+    assert leg_args(["--timing-out=out/t"], "chrome", "leg.xml", "c/chrome") == LEG_TAIL.format(b="chrome").split()
+
+
+def test_leg_gets_own_cache_and_no_cleanup():
+    args = ["--cache-dir", "shared", "--cleanup-prefix=PO Test ", "-q"]
+    assert leg_args(args, "chrome", "leg.xml", "c/chrome") == ["-q", *LEG_TAIL.format(b="chrome").split()]
+
+
+def test_merge_namespaces_cases(tmp_path):
+    legs = {}
+    for browser, failures in (("chrome", 0), ("firefox", 1)):
+        path = tmp_path / f"{browser}.xml"
+        path.write_text(
+            f'<testsuites><testsuite name="pytest" tests="1" failures="{failures}" errors="0" skipped="0">'
+            f'<testcase classname="tests.test_a" name="test_x"/></testsuite></testsuites>')
+        legs[browser] = {"returncode": failures, "seconds": 1.0, "junit": str(path), "summary": None}
+
+    matrix = BrowserMatrix.__new__(BrowserMatrix)
+    matrix.legs = legs
+    merged = matrix.merge()
+
+    cases = [(c.get("classname"), c.get("name")) for c in merged.iter("testcase")]
+    assert cases == [("chrome.tests.test_a", "[chrome] test_x"), ("firefox.tests.test_a", "[firefox] test_x")]
+    assert [s.get("name") for s in merged.findall("testsuite")] == ["chrome", "firefox"]
+    assert legs["firefox"]["summary"]["failures"] == 1
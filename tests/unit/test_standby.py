@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils.standby import StandbyPool
+
+pytestmark = pytest.mark.unit
+
+
+class _Driver:
+    current_url = "about:blank"
+
+    def __init__(self):
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+def _slow_factory(delay, launched):
+    def factory():
+        time.sleep(delay)
+        driver = _Driver()
+        launched.append(driver)
+        return driver
+    return factory
+
+
+def test_acquire_takes_warm_spare_and_refills():
+    launched = []
+    pool = StandbyPool(_slow_factory(0.05, launched), size=1)
+    pool.fill()
+    time.sleep(0.2)
+    driver = pool.acquire()
+    assert driver is launched[0]
+    assert pool.stats["warm"] == 1
+    time.sleep(0.2)
+    pool.close()
+    # замена запускалась в фоне и закрыта вместе с пулом
+    assert len(launched) == 2 and launched[1].closed
+
+
+def test_acquire_waits_for_in_flight_launch_instead_of_starting_another():
+    launched = []
+    pool = StandbyPool(_slow_factory(0.1, launched), size=1)
+    pool.fill()
+    driver = pool.acquire()
+    assert driver is launched[0]
+    pool.close()
+
+
+def test_failed_background_launch_falls_back_without_hanging():
+    calls = []
+
+    def factory():
+        calls.append(threading.current_thread().name)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            raise RuntimeError("no browser")
+        return _Driver()
+
+    pool = StandbyPool(factory, size=1)
+    pool.fill()
+    started = time.monotonic()
+    driver = pool.acquire()
+    assert isinstance(driver, _Driver)
+    assert time.monotonic() - started < 5
+    assert pool.broken is not None
+    # сломанный пул больше не запускает браузеры в фоне
+    assert calls[1] == threading.current_thread().name
+    pool.close()
+
+
+def test_dead_spare_is_discarded():
+    class _Dead(_Driver):
+        @property
+        def current_url(self):
+            raise WebDriverException("gone")
+
+    drivers = [_Dead(), _Driver(), _Driver()]
+    pool = StandbyPool(lambda: drivers.pop(0), size=2)
+    pool.fill()
+    time.sleep(0.1)
+    driver = pool.acquire()
+    assert not isinstance(driver, _Dead)
+    pool.close()
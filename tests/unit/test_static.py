@@ -0,0 +1,144 @@
+import lxml.html
+import pytest
+import requests
+from selenium.webdriver.common.by import By
+
+from utils.static import NeedsBrowser, StaticClient, StaticDriver, _possibly_hidden, select
+
+pytestmark = pytest.mark.unit
+
+HTML = """
+<html><head><title> Your Store </title></head><body>
+  <div id="logo"><a href="/">Shop</a></div>
+  <input name="search" class="form-control input-lg">
+  <ul class="dropdown-menu"><li id="menu-item">Hidden</li></ul>
+  <div class="collapse show"><span id="shown">Open</span></div>
+  <p style="display: none" id="styled">x</p>
+</body></html>
+"""
+
+
+class _Browser:
+    title = "Browser title"
+
+    def __init__(self):
+        self.visited = []
+        self.quit_called = False
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def find_element(self, by, value):
+        return ("browser", by, value)
+
+    def find_elements(self, by, value):
+        return [("browser", by, value)]
+
+    def quit(self):
+        self.quit_called = True
+
+
+class _Session:
+    """Вместо requests.Session: страницы из словаря, остальные — ошибка соединения."""
+
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, timeout=None):
+        if url.rstrip("/") not in self.pages:
+            raise requests.ConnectionError(f"нет соединения с {url}")
+        resp = requests.Response()
+        resp.status_code, resp.url, resp._content = 200, url, self.pages[url.rstrip("/")].encode()
+        return resp
+
+
+def _client(pages):
+    client = StaticClient("http://shop")
+    client.session = _Session(pages)
+    return client
+
+
+@pytest.fixture
+def root():
+    return lxml.html.fromstring(HTML)
+
+
+def _driver(pages):
+    browser = _Browser()
+    return StaticDriver(_client(pages), fallback=lambda: browser), browser
+
+
+@pytest.mark.parametrize("by, value, expected", [
+    (By.ID, "logo", 1),
+    (By.NAME, "search", 1),
+    (By.CLASS_NAME, "form-control", 1),
+    (By.CSS_SELECTOR, "#logo a", 1),
+    (By.TAG_NAME, "li", 1),
+    (By.LINK_TEXT, "Shop", 1),
+    (By.PARTIAL_LINK_TEXT, "Sho", 1),
+    (By.XPATH, "//ul/li", 1),
+    (By.ID, "missing", 0),
+])
+def test_select_strategies(root, by, value, expected):
+    assert len(select(root, by, value)) == expected
+
+
+@pytest.mark.parametrize("by, value", [
+    (By.XPATH, "count(//li)"),
+    (By.CSS_SELECTOR, "a:::broken"),
+    ("shadow", "x"),
+])
+def test_select_unsupported_needs_browser(root, by, value):
+    with pytest.raises(NeedsBrowser):
+        select(root, by, value)
+
+
+@pytest.mark.parametrize("element_id, hidden", [
+    ("logo", False),
+    ("menu-item", True),   # внутри dropdown-menu
+    ("shown", False),      # collapse.show раскрыт
+    ("styled", True),
+])
+def test_possibly_hidden(root, element_id, hidden):
+    assert _possibly_hidden(select(root, By.ID, element_id)[0]) is hidden
+
+
+def test_static_driver_answers_from_html_without_browser():
+    driver, browser = _driver({"http://shop": HTML})
+    driver.get("http://shop/")
+    assert driver.title == "Your Store"
+    assert driver.find_element(By.ID, "logo").text == "Shop"
+    assert driver._fallback is None
+    assert driver.client.stats["static"] == 1
+
+
+def test_static_driver_falls_back_for_hidden_element():
+    driver, browser = _driver({"http://shop": HTML})
+    driver.get("http://shop")
+    assert driver.find_element(By.ID, "menu-item") == ("browser", By.ID, "menu-item")
+    assert browser.visited == ["http://shop"]
+
+
+def test_static_driver_falls_back_when_page_fails_to_download():
+    driver, browser = _driver({})
+    driver.get("http://shop/down")
+    assert driver.current_url == "http://shop/down"
+    assert driver.title == "Browser title"
+    assert driver.find_elements(By.ID, "logo") == [("browser", By.ID, "logo")]
+    assert browser.visited == ["http://shop/down"]
+    assert any("страница не скачалась" in key for key in driver.client.stats["fallbacks"])
+
+
+def test_prefetch_skips_cached_and_logs_failures(caplog):
+    client = _client({"http://shop": HTML})
+    client.prefetch(["http://shop", "http://shop/", "http://shop/down"])
+    assert client.stats["prefetched"] == 1
+    assert "http://shop/down" in caplog.text
+    client.page("http://shop/")
+    assert client.stats["hits"] == 1
+
+
+def test_http_error_is_a_download_failure():
+    client = StaticClient("http://127.0.0.1:9", timeout=1)
+    with pytest.raises(requests.RequestException):
+        client.page("http://127.0.0.1:9/")
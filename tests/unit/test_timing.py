@@ -0,0 +1,52 @@
+import pytest
+
+from utils.timing import percentile, route_of
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize("values, p, expected", [
+    ([], 50, None),
+    ([7], 99, 7),
+    ([5, 1, 3], 0, 1),
+    ([5, 1, 3], 50, 3),
+    ([5, 1, 3], 100, 5),
+    ([1, 2, 3, 4], 50, 2),
+    ([1, 2, 3, 4], 51, 3),
+    ([1, 2, 3, 4], 99.9, 4),
+    (list(range(1, 101)), 90, 90),
+    ([0.2, 0.1], 90, 0.2),
+])
+def test_percentile_nearest_rank(values, p, expected):
+    assert percentile(values, p) == expected
+
+
+def test_percentile_accepts_any_iterable_and_keeps_input():
+    values = [3, 1, 2]
+    assert percentile(values, 50) == 2
+    assert values == [3, 1, 2]
+    assert percentile(range(10, 0, -1), 10) == 1
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("http://shop/", "common/home"),
+    ("http://shop/index.php", "common/home"),
+    ("http://shop/index.php?route=product/category&path=20", "product/category"),
+    ("http://shop/index.php?language=en-gb&route=product/product&product_id=40", "product/product"),
+    ("http://shop/administration", "admin:common/login"),
+    ("http://shop/administration/index.php", "admin:common/login"),
+    ("http://shop/administration/index.php?route=common/dashboard&user_token=x", "admin:common/dashboard"),
+    ("http://shop/administration-old/index.php?route=common/dashboard", "common/dashboard"),
+])
+def test_route_of(url, expected):
+    assert route_of(url) == expected
+
+
+@pytest.mark.parametrize("prefix, expected", [
+    ("/admin", "admin:catalog/product"),
+    ("/admin/", "admin:catalog/product"),
+    ("", "catalog/product"),
+    (None, "catalog/product"),
+])
+def test_route_of_custom_admin_path(prefix, expected):
+    assert route_of("http://shop/admin/index.php?route=catalog/product", admin_path=prefix) == expected
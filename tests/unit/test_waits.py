@@ -0,0 +1,33 @@
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from utils.budget import budget
+from utils.waits import BudgetWait
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def test_budget():
+    yield budget
+    budget.end_test()
+
+
+def test_budget_wait_shrinks_on_each_until(test_budget):
+    wait = BudgetWait(object(), 10, poll_frequency=0.05)
+    test_budget.start_test(0.5)
+    started = time.monotonic()
+    with pytest.raises(TimeoutException):
+        wait.until(lambda d: False)
+    # второй until того же объекта ждёт только остаток бюджета, а не 10 секунд
+    with pytest.raises(TimeoutException):
+        wait.until(lambda d: False)
+    assert time.monotonic() - started < 2
+
+
+def test_budget_wait_without_budget_keeps_requested_timeout():
+    wait = BudgetWait(object(), 3)
+    assert wait.until(lambda d: "ok") == "ok"
+    assert wait._timeout == 3
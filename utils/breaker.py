@@ -0,0 +1,127 @@
+# utils/breaker.py
+
+import logging
+
+import pytest
+import requests
+
+from utils.budget import budget
+
+logger = logging.getLogger(__name__)
+
+# page objects и тесты начинают этим текстом сообщение о неудачном входе в админку
+ADMIN_LOGIN_FAILED = "Вход в админку не выполнен"
+
+# признаки недоступного стенда: дальше ждать бесполезно
+CONNECTION_ERRORS = (
+    "ERR_CONNECTION_REFUSED", "ERR_NAME_NOT_RESOLVED", "ERR_CONNECTION_TIMED_OUT",
+    "ERR_ADDRESS_UNREACHABLE", "Connection refused", "NewConnectionError",
+)
+# повторяющиеся падения считаем только у ожиданий элементов: обычный assert — это регрессия, а не поломка стенда
+# ("Не дождался" — так utils.waits и BasePage сообщают о TimeoutException)
+WAIT_FAILURES = ("TimeoutException", "NoSuchElementException", "Не дождался")
+
+
+def failure_signature(report):
+    """Первая строка сообщения об ошибке — по ней отличаем «одно и то же падение»."""
+    crash = getattr(report.longrepr, "reprcrash", None)
+    message = (crash.message if crash else str(report.longrepr)).strip()
+    first = message.splitlines()[0] if message else "unknown"
+    if crash and first.endswith("Message:"):
+        # голый TimeoutException без текста: различаем по месту падения
+        first += f" @ {crash.path}:{crash.lineno}"
+    return first
+
+
+class CircuitBreaker:
+    """
+    Быстрый отказ при системной поломке: стенд недоступен, одна и та же ошибка повторяется,
+    не удаётся войти в админку. После срабатывания зависимые тесты падают сразу с причиной.
+
+    Области: "all" — стенд недоступен, "admin" — тесты с маркером admin, "module:<путь>" — модули,
+    где повторилось одно и то же падение ожидания (чужой локатор не останавливает остальной прогон).
+    """
+
+    def __init__(self, config):
+        self.threshold = config.getoption("--breaker-threshold")
+        self.base_url = config.getoption("--base-url").rstrip("/")
+        self.enabled = not config.getoption("--no-breaker")
+        self.preflight = self.enabled and not config.getoption("--no-preflight")
+        self.test_budget = config.getoption("--test-budget")
+        self.tripped = {}   # scope ("all" | "admin" | "module:<путь>") -> причина
+        self.signatures = {}   # сигнатура -> тестовые функции (параметризации считаются одной)
+        self.repeated = {}   # сигнатура, набравшая порог -> причина
+        budget.start_run(config.getoption("--run-budget"))
+
+    def trip(self, scope, reason):
+        if scope not in self.tripped:
+            logger.error(f"Circuit breaker ({scope}): {reason}")
+            self.tripped[scope] = reason
+
+    def pytest_collection_finish(self, session):
+        # стенд нужен только не-unit тестам: unit-тесты идут и без него
+        if not self.preflight or session.config.option.collectonly:
+            return
+        if all(item.get_closest_marker("unit") for item in session.items):
+            return
+        try:
+            resp = requests.get(self.base_url + "/", timeout=5)
+        except requests.Timeout:
+            self.trip("all", f"стенд {self.base_url} не ответил за 5 секунд")
+        except requests.RequestException as e:
+            self.trip("all", f"стенд {self.base_url} недоступен: {e}")
+        else:
+            # редиректы requests уже прошёл: 4xx/5xx — витрина не работает
+            if resp.status_code >= 400:
+                self.trip("all", f"стенд {self.base_url} ответил HTTP {resp.status_code}")
+
+    def _reason_for(self, item):
+        if item.get_closest_marker("unit"):
+            return None
+        if "all" in self.tripped:
+            return self.tripped["all"]
+        if "admin" in self.tripped and item.get_closest_marker("admin"):
+            return self.tripped["admin"]
+        module = "module:" + item.nodeid.split("::", 1)[0]
+        if module in self.tripped:
+            return self.tripped[module]
+        if budget.run_exhausted():
+            return "исчерпан бюджет времени прогона (--run-budget)"
+        return None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        reason = self._reason_for(item)
+        if reason:
+            pytest.fail(f"Circuit breaker: {reason}", pytrace=False)
+        budget.start_test(self.test_budget)
+
+    def pytest_runtest_teardown(self, item):
+        budget.end_test()
+
+    def pytest_runtest_logreport(self, report):
+        if not self.enabled or not report.failed or report.when == "teardown":
+            return
+        signature = failure_signature(report)
+        if signature.startswith("Circuit breaker"):
+            return
+        if any(sign in signature for sign in CONNECTION_ERRORS):
+            self.trip("all", f"стенд недоступен: {signature}")
+            return
+        if ADMIN_LOGIN_FAILED in signature:
+            self.trip("admin", signature)
+            return
+        if not any(sign in signature for sign in WAIT_FAILURES):
+            return
+        functions = self.signatures.setdefault(signature, set())
+        functions.add(report.nodeid.split("[", 1)[0])
+        if signature not in self.repeated and len(functions) >= self.threshold:
+            self.repeated[signature] = f"{signature} (в {len(functions)} тестах)"
+        if signature in self.repeated:
+            # останавливаем модули, где это падение встретилось; позже — и каждый новый такой модуль
+            for module in {nodeid.split("::", 1)[0] for nodeid in functions}:
+                self.trip(f"module:{module}", self.repeated[signature])
+
+    def pytest_terminal_summary(self, terminalreporter):
+        for scope, reason in self.tripped.items():
+            terminalreporter.write_line(f"circuit breaker [{scope}]: {reason}", red=True)
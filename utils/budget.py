@@ -0,0 +1,44 @@
+# utils/budget.py
+
+import time
+
+
+class Budget:
+    """
+    Дедлайны прогона и текущего теста.
+
+    Все ожидания берут таймаут через budget.timeout(): пока времени много, он равен запрошенному,
+    а ближе к дедлайну ужимается до остатка — сломанное окружение не ждёт полные 10–30 секунд на каждом шаге.
+    """
+
+    def __init__(self):
+        self.run_deadline = None
+        self.test_deadline = None
+
+    def start_run(self, seconds=0):
+        self.run_deadline = time.monotonic() + seconds if seconds else None
+
+    def start_test(self, seconds=0):
+        self.test_deadline = time.monotonic() + seconds if seconds else None
+
+    def end_test(self):
+        self.test_deadline = None
+
+    def remaining(self):
+        """Секунд до ближайшего дедлайна (None — бюджет не задан)."""
+        deadlines = [d for d in (self.run_deadline, self.test_deadline) if d is not None]
+        if not deadlines:
+            return None
+        return min(deadlines) - time.monotonic()
+
+    def run_exhausted(self):
+        return self.run_deadline is not None and time.monotonic() >= self.run_deadline
+
+    def timeout(self, requested):
+        remaining = self.remaining()
+        if remaining is None:
+            return requested
+        return max(0.0, min(requested, remaining))
+
+
+budget = Budget()
@@ -0,0 +1,250 @@
+# utils/catalog.py
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse, parse_qs
+
+import requests
+
+from utils.http import pooled_session
+
+logger = logging.getLogger(__name__)
+
+# по умолчанию — .cache в корне проекта, а не в текущем каталоге (pytest передаёт свой --cache-dir)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+# откуда брать цену товара, по убыванию надёжности: h2 — только если классов цены в теме нет
+PRICE_SOURCES = ("price-new", "price", "h2")
+PRICE_RE = re.compile(r"[$€£]\s?[\d.,]+|[\d.,]+\s?[$€£]")
+
+
+def _query(href: str) -> dict:
+    return {k: v[0] for k, v in parse_qs(urlparse(href).query).items()}
+
+
+def parse_price(text: str):
+    """'$1,202.00' / '1.202,00€' -> 1202.0, '12,5€' -> 12.5 (None, если цены нет)."""
+    m = PRICE_RE.search(text or "")
+    if not m:
+        return None
+    digits = re.sub(r"[^\d.,]", "", m.group(0))
+    if "," in digits and "." in digits:
+        # разделитель дробной части — последний из встреченных
+        if digits.rfind(",") > digits.rfind("."):
+            digits = digits.replace(".", "").replace(",", ".")
+        else:
+            digits = digits.replace(",", "")
+    else:
+        # одна запятая и 1-2 цифры после неё — дробная часть ("12,5€"), иначе разделитель тысяч
+        decimal = digits.count(",") == 1 and re.search(r",\d{1,2}$", digits)
+        digits = digits.replace(",", ".") if decimal else digits.replace(",", "")
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+class _LinkParser(HTMLParser):
+    """Собирает ссылки на категории и товары со страницы витрины."""
+
+    def __init__(self, page_url):
+        super().__init__()
+        self.page_url = page_url
+        self.categories = set()
+        self.products = set()
+
+    def handle_starttag(self, tag, attrs):
+        if tag != "a":
+            return
+        href = dict(attrs).get("href") or ""
+        if "route=product/category" in href:
+            path = _query(href).get("path")
+            if path:
+                self.categories.add(path)
+        elif "product_id=" in href:
+            product_id = _query(urljoin(self.page_url, href)).get("product_id")
+            if product_id and product_id.isdigit():
+                self.products.add(product_id)
+
+
+class _ProductParser(HTMLParser):
+    """Вытаскивает со страницы товара название, цену и обязательные опции."""
+
+    def __init__(self):
+        super().__init__()
+        self.name = ""
+        self.prices = dict.fromkeys(PRICE_SOURCES)   # первая цена из каждого источника
+        self.required_options = {}
+        self._divs = []          # стек флагов "div.required"
+        self._in_h1 = False
+        self._price_tags = []    # открытые (тег, [источники цены])
+
+    @property
+    def price(self):
+        return next((self.prices[source] for source in PRICE_SOURCES if self.prices[source] is not None), None)
+
+    def _inside_required(self):
+        return any(self._divs)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        if tag == "div":
+            self._divs.append("required" in classes)
+        if tag == "h1" and not self.name:
+            self._in_h1 = True
+        sources = [s for s in PRICE_SOURCES if self.prices[s] is None and (tag == s or s in classes)]
+        if sources:
+            self._price_tags.append((tag, sources))
+        name = attrs.get("name") or ""
+        if tag in ("input", "select", "textarea") and name.startswith("option[") and self._inside_required():
+            option_id = name[len("option["):].split("]", 1)[0]
+            kind = attrs.get("type", tag) if tag == "input" else tag
+            self.required_options.setdefault(option_id, kind)
+
+    def handle_endtag(self, tag):
+        if tag == "div" and self._divs:
+            self._divs.pop()
+        if tag == "h1":
+            self._in_h1 = False
+        # HTMLParser не проверяет вложенность: закрываем последний открытый с этим тегом
+        for i in range(len(self._price_tags) - 1, -1, -1):
+            if self._price_tags[i][0] == tag:
+                del self._price_tags[i:]
+                break
+
+    def handle_data(self, data):
+        if self._in_h1:
+            self.name += data.strip()
+        for _, sources in self._price_tags:
+            for source in sources:
+                if self.prices[source] is None:
+                    self.prices[source] = parse_price(data)
+
+
+class Catalog:
+    """Индекс товаров витрины: id, категории, цены и обязательные опции."""
+
+    def __init__(self, base_url, products=None, created=None):
+        self.base_url = base_url.rstrip("/")
+        self.products = products or {}
+        self.created = created or time.time()
+
+    def __len__(self):
+        return len(self.products)
+
+    def product_url(self, product_id):
+        return f"{self.base_url}/index.php?route=product/product&product_id={product_id}"
+
+    def query(self, category=None, required_options=None, min_price=None, max_price=None):
+        """Фильтрует товары индекса. required_options=False — только товары без обязательных опций."""
+        result = []
+        for product in self.products.values():
+            # path "20_27" относится и к категории 20, и к подкатегории 27
+            if category is not None and not any(str(category) in path.split("_") for path in product["categories"]):
+                continue
+            if required_options is not None and bool(product["required_options"]) != required_options:
+                continue
+            price = product["price"]
+            if min_price is not None and (price is None or price < min_price):
+                continue
+            if max_price is not None and (price is None or price > max_price):
+                continue
+            result.append(product)
+        return result
+
+    def random_products(self, k=1, **filters):
+        found = self.query(**filters)
+        return random.sample(found, k=min(k, len(found)))
+
+    def to_dict(self):
+        return {"base_url": self.base_url, "created": self.created, "products": self.products}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["base_url"], data["products"], data["created"])
+
+
+def _fetch(session, url, timeout):
+    try:
+        resp = session.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.text
+    except requests.RequestException as e:
+        logger.warning(f"Не удалось загрузить {url}: {e}")
+        return ""
+
+
+def crawl(base_url, workers=8, max_categories=50, timeout=10):
+    """Параллельно обходит категории и карточки товаров по HTTP и строит Catalog."""
+    base_url = base_url.rstrip("/")
+    session = pooled_session(workers)
+    products = {}
+
+    home = base_url + "/"
+    links = _LinkParser(home)
+    links.feed(_fetch(session, home, timeout))
+    categories = sorted(links.categories)[:max_categories]
+    for product_id in links.products:
+        products.setdefault(product_id, {"categories": []})
+
+    def category_page(path):
+        url = f"{base_url}/index.php?route=product/category&path={path}&limit=100"
+        parser = _LinkParser(url)
+        parser.feed(_fetch(session, url, timeout))
+        return path, parser.products
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, found in pool.map(category_page, categories):
+            for product_id in found:
+                products.setdefault(product_id, {"categories": []})["categories"].append(path)
+
+        def product_page(product_id):
+            url = f"{base_url}/index.php?route=product/product&product_id={product_id}"
+            parser = _ProductParser()
+            parser.feed(_fetch(session, url, timeout))
+            return product_id, parser
+
+        for product_id, parser in pool.map(product_page, sorted(products)):
+            products[product_id].update({
+                "id": product_id,
+                "name": parser.name,
+                "price": parser.price,
+                "required_options": parser.required_options,
+            })
+
+    # страницы, которые не загрузились, в индекс не попадают
+    products = {pid: p for pid, p in products.items() if p.get("name")}
+    logger.info(f"Каталог {base_url}: {len(categories)} категорий, {len(products)} товаров")
+    return Catalog(base_url, products)
+
+
+def _cache_path(base_url, cache_dir=CACHE_DIR):
+    digest = hashlib.sha1(base_url.rstrip("/").encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, f"catalog-{digest}.json")
+
+
+def load_catalog(base_url, ttl=3600, workers=8, cache_dir=CACHE_DIR):
+    """Catalog из дискового кеша в cache_dir, если он моложе ttl секунд, иначе — свежий обход."""
+    path = _cache_path(base_url, cache_dir)
+    if ttl > 0 and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                catalog = Catalog.from_dict(json.load(f))
+            if time.time() - catalog.created < ttl and len(catalog):
+                return catalog
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Кеш каталога {path} повреждён: {e}")
+
+    catalog = crawl(base_url, workers=workers)
+    if ttl > 0 and len(catalog):
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(catalog.to_dict(), f, ensure_ascii=False, indent=1)
+    return catalog
@@ -0,0 +1,64 @@
+# utils/drivers.py
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+# --lean: флаги, срезающие память и фоновую активность браузера (экономию показывает --monitor-resources)
+LEAN_CHROME_ARGS = (
+    "--disable-extensions",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--renderer-process-limit=2",
+)
+LEAN_FIREFOX_PREFS = {
+    "dom.ipc.processCount": 1,
+    "browser.cache.memory.capacity": 16384,
+    "browser.sessionhistory.max_total_viewers": 0,
+    "extensions.update.enabled": False,
+    "app.update.enabled": False,
+}
+
+
+def create_driver(name, headless=False, page_load_strategy="normal", lean=False):
+    """Запускает браузер по имени: chrome | firefox | safari"""
+    name = name.lower()
+
+    if name == "chrome":
+        options = ChromeOptions()
+        options.page_load_strategy = page_load_strategy
+        if headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--window-size=1280,900")
+        if lean:
+            for arg in LEAN_CHROME_ARGS:
+                options.add_argument(arg)
+        driver = webdriver.Chrome(service=ChromeService(), options=options)
+
+    elif name == "firefox":
+        options = FirefoxOptions()
+        options.page_load_strategy = page_load_strategy
+        if headless:
+            options.add_argument("-headless")
+        if lean:
+            for pref, value in LEAN_FIREFOX_PREFS.items():
+                options.set_preference(pref, value)
+        driver = webdriver.Firefox(service=FirefoxService(), options=options)
+        driver.set_window_size(1280, 900)
+
+    elif name == "safari":
+        driver = webdriver.Safari()
+
+    else:
+        raise pytest.UsageError(f"Unknown --browser={name}")
+
+    return driver
@@ -0,0 +1,13 @@
+# utils/http.py
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def pooled_session(maxsize, connections=None):
+    """requests.Session с пулом соединений: maxsize соединений на хост, connections хостов в пуле."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=connections or maxsize, pool_maxsize=maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
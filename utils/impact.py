@@ -0,0 +1,247 @@
+# utils/impact.py
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+MAP_NAME = "impact-map.json"   # в --cache-dir
+WATCHED_DIRS = ("pages", "utils", "tests")
+# изменения в этих файлах затрагивают все тесты — карта устаревает целиком
+GLOBAL_FILES = ("conftest.py", "pytest.ini", "requirements.txt")
+
+
+def _git(root, *args):
+    try:
+        out = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout if out.returncode == 0 else None
+
+
+def changed_files(root, commit):
+    """Файлы, изменённые относительно commit (включая незакоммиченные и новые), или None."""
+    diff = _git(root, "diff", "--name-only", commit)
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard")
+    if diff is None or untracked is None:
+        return None
+    return {line.strip() for line in (diff + untracked).splitlines() if line.strip()}
+
+
+class ImpactRecorder:
+    """Записывает, какие функции и локаторы из pages/, utils/ и tests/ вызываются во время теста."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.prefixes = tuple(os.path.join(self.root, d) + os.sep for d in WATCHED_DIRS)
+        self._codes = {}   # code object -> (relpath, qualname) | None
+        self._types = {}   # класс -> relpath модуля | None
+        self.files = set()
+        self.functions = set()
+        self.locators = set()
+        self.sinks = []   # дополнительные приёмники файлов: код фикстур (см. ImpactPlugin)
+
+    def _add_file(self, rel):
+        self.files.add(rel)
+        for sink in self.sinks:
+            sink.add(rel)
+
+    def _key(self, code):
+        if code not in self._codes:
+            filename = code.co_filename
+            if filename.startswith(self.prefixes) and filename != __file__:
+                rel = os.path.relpath(filename, self.root).replace(os.sep, "/")
+                self._codes[code] = (rel, getattr(code, "co_qualname", code.co_name))
+            else:
+                self._codes[code] = None
+        return self._codes[code]
+
+    def _type_file(self, cls):
+        """Файл, где объявлен класс: страница может не вызывать ни одного собственного метода."""
+        if cls not in self._types:
+            filename = getattr(sys.modules.get(cls.__module__), "__file__", None) or ""
+            self._types[cls] = (os.path.relpath(filename, self.root).replace(os.sep, "/")
+                                if filename.startswith(self.prefixes) else None)
+        return self._types[cls]
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        key = self._key(frame.f_code)
+        if key is None:
+            return
+        self._add_file(key[0])
+        self.functions.add(f"{key[0]}::{key[1]}")
+        if key[1] == "Element.__get__":
+            descriptor, owner = frame.f_locals.get("self"), frame.f_locals.get("owner")
+            if owner is not None and getattr(descriptor, "name", None):
+                self.locators.add(f"{owner.__name__}.{descriptor.name}")
+                owner_file = self._type_file(owner)
+                if owner_file:
+                    self._add_file(owner_file)
+        elif "self" in frame.f_code.co_varnames[:1]:
+            self_file = self._type_file(type(frame.f_locals["self"]))
+            if self_file:
+                self._add_file(self_file)
+
+    def start(self):
+        self.files, self.functions, self.locators = set(), set(), set()
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        sys.setprofile(None)
+        threading.setprofile(None)
+        return {
+            "files": sorted(self.files),
+            "functions": sorted(self.functions),
+            "locators": sorted(self.locators),
+        }
+
+
+class ImpactPlugin:
+    """--impact-record пишет карту тест -> код, --impact запускает только затронутые изменениями тесты."""
+
+    def __init__(self, config):
+        self.root = str(config.rootpath)
+        self.record = config.getoption("--impact-record")
+        self.select = config.getoption("--impact")
+        self.path = os.path.join(self.root, config.getoption("--cache-dir"), MAP_NAME)
+        self.recorder = ImpactRecorder(self.root)
+        self.recorded = {}
+        self.fixture_files = {}   # имя фикстуры -> файлы её кода (setup и финализация)
+        self._teardown_sink = None
+        self.summary = ""
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _affected(self, items, data):
+        """Отобранные тесты или None, если нужен полный прогон."""
+        if not data:
+            return None, "карта влияния не найдена (запустите с --impact-record)"
+        diffs = {}   # коммит -> изменённые с него файлы | None
+
+        def changed_since(commit):
+            if commit not in diffs:
+                diffs[commit] = changed_files(self.root, commit)
+            return diffs[commit]
+
+        tests = data.get("tests", {})
+        selected, stale = [], 0
+        prefixes = tuple(d + "/" for d in WATCHED_DIRS)
+        for item in items:
+            entry = tests.get(item.nodeid)
+            # новых тестов в карте нет — их запускаем всегда
+            if entry is None:
+                selected.append(item)
+                continue
+            # каждая запись сравнивается со своим коммитом: тесты, не перезаписанные
+            # в последнем --impact-record, записаны на более старом коммите
+            changed = changed_since(entry.get("commit") or data.get("commit", ""))
+            if changed is None or any(f in GLOBAL_FILES for f in changed):
+                stale += 1
+                selected.append(item)
+                continue
+            changed = {f for f in changed if f.startswith(prefixes)}
+            if item.nodeid.split("::", 1)[0] in changed or changed.intersection(entry["files"]):
+                selected.append(item)
+        reason = f"сравнение с коммитами карты: {len(diffs)}"
+        if stale:
+            reason += f", устаревших записей (недоступный коммит или общие файлы): {stale}"
+        return selected, reason
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self.select:
+            return
+        selected, reason = self._affected(items, self._load())
+        if selected is None:
+            self.summary = f"impact: полный прогон — {reason}"
+            return
+        chosen = set(map(id, selected))
+        deselected = [item for item in items if id(item) not in chosen]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = f"impact: {reason}, выбрано тестов {len(selected)} из {len(selected) + len(deselected)}"
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if not self.record:
+            yield
+            return
+        self.recorder.start()
+        try:
+            yield
+        finally:
+            self.recorded[item.nodeid] = {**self.recorder.stop(), "fixtures": sorted(item.fixturenames)}
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        """Код фикстуры относим к фикстуре: session-фикстура создаётся в первом тесте, а нужна всем."""
+        if not self.record:
+            yield
+            return
+        sink = set()
+        self.recorder.sinks.append(sink)
+        try:
+            yield
+        finally:
+            self.recorder.sinks.remove(sink)
+            self.fixture_files.setdefault(fixturedef.argname, set()).update(sink)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        # финализаторы идут по очереди: всё, что выполнилось до post_finalizer, — код этой фикстуры
+        if not self.record:
+            yield
+            return
+        self._teardown_sink = set()
+        self.recorder.sinks.append(self._teardown_sink)
+        try:
+            yield
+        finally:
+            self.recorder.sinks.remove(self._teardown_sink)
+            self._teardown_sink = None
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        if self._teardown_sink is not None:
+            self.fixture_files.setdefault(fixturedef.argname, set()).update(self._teardown_sink)
+            self._teardown_sink.clear()
+
+    def pytest_sessionfinish(self, session):
+        if not self.record or not self.recorded:
+            return
+        head = _git(self.root, "rev-parse", "HEAD")
+        if head is None:
+            logger.warning("--impact-record: не git-репозиторий, карта не сохранена")
+            return
+        head = head.strip()
+        # тесты, не попавшие в этот прогон, сохраняют прежние записи вместе со своим коммитом
+        tests = (self._load() or {}).get("tests", {})
+        for nodeid, entry in self.recorded.items():
+            files = set(entry["files"])
+            for name in entry["fixtures"]:
+                files |= self.fixture_files.get(name, set())
+            tests[nodeid] = {**entry, "files": sorted(files), "commit": head}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"commit": head, "tests": tests}, f, ensure_ascii=False, indent=1)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.summary:
+            terminalreporter.write_line(self.summary)
+        if self.record and self.recorded:
+            terminalreporter.write_line(
+                f"impact: записана карта для {len(self.recorded)} тестов -> {os.path.relpath(self.path, self.root)}")
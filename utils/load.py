@@ -0,0 +1,297 @@
+# utils/load.py
+"""
+Нагрузочный режим: сценарии тестов как виртуальные пользователи.
+
+    python -m utils.load --base-url http://localhost:8081 --ramp 5:30,20:60 --browsers 1
+
+Большинство пользователей работает на уровне HTTP (requests.Session с пулом соединений,
+разбор HTML), --browsers N из них — настоящие браузеры с page objects.
+"""
+
+import abc
+import argparse
+import json
+import logging
+import os
+import random
+import threading
+import time
+from html.parser import HTMLParser
+
+from pages.category_page import CategoryPage
+from pages.components.currency_dropdown import CurrencyDropdown
+from pages.main_page import MainPage
+from pages.product_page import ProductPage
+from pages.register_page import RegisterPage
+from utils.catalog import load_catalog
+from utils.drivers import create_driver
+from utils.http import pooled_session
+from utils.timing import percentile
+
+logger = logging.getLogger(__name__)
+
+STEPS = ("home", "category", "product", "add_to_cart", "currency", "register")
+CURRENCIES = (("EUR", "€ Euro"), ("GBP", "£ Pound Sterling"), ("USD", "$ US Dollar"))
+
+
+class Stats:
+    """Потокобезопасный сбор длительностей и ошибок по шагам."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}   # step -> [(elapsed, ok)]
+        self.errors = {}    # step -> {сообщение: количество}
+        self.started = time.monotonic()
+
+    def record(self, step, elapsed, error=None):
+        with self.lock:
+            self.samples.setdefault(step, []).append((elapsed, error is None))
+            if error is not None:
+                bucket = self.errors.setdefault(step, {})
+                bucket[error] = bucket.get(error, 0) + 1
+
+    def report(self):
+        duration = time.monotonic() - self.started
+        result = {}
+        with self.lock:
+            for step, samples in self.samples.items():
+                ok = [e * 1000 for e, success in samples if success]
+                result[step] = {
+                    "requests": len(samples),
+                    "rps": round(len(samples) / duration, 2),
+                    "error_rate": round(1 - len(ok) / len(samples), 3),
+                    "p50_ms": percentile(ok, 50),
+                    "p90_ms": percentile(ok, 90),
+                    "p99_ms": percentile(ok, 99),
+                    "errors": self.errors.get(step, {}),
+                }
+        return {"duration_s": round(duration, 1), "steps": result}
+
+
+class _FormParser(HTMLParser):
+    """action и скрытые поля формы с заданным id."""
+
+    def __init__(self, form_id):
+        super().__init__()
+        self.form_id = form_id
+        self.action = None
+        self.fields = {}
+        self._inside = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form" and attrs.get("id") == self.form_id:
+            self._inside = True
+            self.action = attrs.get("action")
+        elif self._inside and tag == "input" and attrs.get("type") == "hidden" and attrs.get("name"):
+            self.fields[attrs["name"]] = attrs.get("value") or ""
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self._inside = False
+
+
+class VirtualUser(abc.ABC):
+    """Один пользователь: проходит сценарий витрины по кругу, пока нагрузка его не остановит."""
+
+    def __init__(self, index, base_url, catalog, stats, think=0.5):
+        self.index = index
+        self.base_url = base_url
+        self.catalog = catalog
+        self.stats = stats
+        self.think = think
+
+    def step(self, name, action):
+        started = time.monotonic()
+        try:
+            action()
+        except Exception as e:
+            self.stats.record(name, time.monotonic() - started, f"{type(e).__name__}: {e}"[:200])
+        else:
+            self.stats.record(name, time.monotonic() - started)
+        time.sleep(self.think)
+
+    @abc.abstractmethod
+    def iteration(self):
+        """Один проход сценария: шаги через self.step, чтобы они попали в статистику."""
+
+    def close(self):
+        pass
+
+    def run(self, should_run):
+        try:
+            while should_run(self.index):
+                self.iteration()
+        finally:
+            self.close()
+
+
+class HttpUser(VirtualUser):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # у каждого пользователя своя корзина — значит, своя сессия с cookie
+        self.session = pooled_session(4, connections=2)
+
+    def _get(self, url):
+        resp = self.session.get(url, timeout=30)
+        resp.raise_for_status()
+        return resp.text
+
+    def _post_json(self, url, data):
+        resp = self.session.post(url, data=data, timeout=30)
+        resp.raise_for_status()
+        try:
+            payload = resp.json()
+        except ValueError:
+            return {}
+        if payload.get("error"):
+            raise AssertionError(f"OpenCart вернул ошибку: {payload['error']}")
+        return payload
+
+    def iteration(self):
+        product = random.choice(self.catalog.query(required_options=False))
+        category = random.choice(product["categories"] or ["20"])
+        url = self.base_url + "/index.php?route="
+
+        self.step("home", lambda: self._get(self.base_url + "/"))
+        self.step("category", lambda: self._get(f"{url}product/category&path={category}"))
+        self.step("product", lambda: self._get(f"{url}product/product&product_id={product['id']}"))
+        self.step("add_to_cart", lambda: self._post_json(
+            f"{url}checkout/cart.add", {"product_id": product["id"], "quantity": 1}))
+        code, _ = random.choice(CURRENCIES)
+        self.step("currency", lambda: self._post_json(
+            f"{url}common/currency.save", {"code": code, "redirect": self.base_url + "/"}))
+        self.step("register", self._register)
+
+    def _register(self):
+        form = _FormParser("form-register")
+        form.feed(self._get(self.base_url + "/index.php?route=account/register"))
+        if not form.action:
+            raise AssertionError("Форма регистрации не найдена")
+        email = f"load_{self.index}_{time.time_ns()}@mail.com"
+        self._post_json(form.action.replace("&amp;", "&"), {
+            **form.fields,
+            "firstname": "Load", "lastname": "User", "email": email,
+            "telephone": "0123456789", "password": "password123", "agree": "1",
+        })
+
+    def close(self):
+        self.session.close()
+
+
+class BrowserUser(VirtualUser):
+    def __init__(self, *args, browser="chrome", headless=True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.driver = create_driver(browser, headless=headless)
+        self.driver.set_page_load_timeout(30)
+
+    def iteration(self):
+        product = random.choice(self.catalog.query(required_options=False))
+        category = random.choice(product["categories"] or ["20"])
+
+        self.step("home", lambda: MainPage(self.driver).open_home(self.base_url).wait_visible(MainPage.PRODUCT_TILES))
+        self.step("category", lambda: CategoryPage(self.driver).open_by_path(self.base_url, category)
+                  .wait_visible(CategoryPage.PRODUCT_TILES))
+        page = ProductPage(self.driver)
+        self.step("product", lambda: page.open(self.catalog.product_url(product["id"])).wait_visible(ProductPage.TITLE_H1))
+        self.step("add_to_cart", lambda: self._add_to_cart(page))
+        _, name = random.choice(CURRENCIES)
+        self.step("currency", lambda: CurrencyDropdown(self.driver).open(self.base_url + "/").choose_currency(name))
+        email = f"load_b{self.index}_{time.time_ns()}@mail.com"
+        self.step("register", lambda: RegisterPage(self.driver).open_register(self.base_url)
+                  .register("Load", "User", email, "password123"))
+        # новая итерация — новый покупатель
+        self.driver.delete_all_cookies()
+
+    @staticmethod
+    def _add_to_cart(page):
+        # шаг длится до ответа магазина (alert-success), как и HTTP-запрос cart.add у HttpUser
+        verdict = page.submit(ProductPage.BUTTON_CART, alert_success=True)
+        if not verdict["ok"]:
+            raise AssertionError(f"Товар не добавлен в корзину: {verdict['state']} {verdict['messages']}")
+
+    def close(self):
+        self.driver.quit()
+
+
+def parse_ramp(spec):
+    """'5:30,20:60' -> [(5, 30.0), (20, 60.0)]: сколько пользователей и сколько секунд держать."""
+    stages = []
+    for chunk in spec.split(","):
+        users, seconds = chunk.split(":")
+        stages.append((int(users), float(seconds)))
+    return stages
+
+
+def run_load(base_url, stages, browsers=0, browser="chrome", headless=True, think=0.5):
+    base_url = base_url.rstrip("/")
+    catalog = load_catalog(base_url)
+    if not catalog.query(required_options=False):
+        raise SystemExit(f"В каталоге {base_url} нет товаров без обязательных опций")
+
+    stats = Stats()
+    target = {"users": 0}
+    stop = threading.Event()
+    threads = {}   # индекс пользователя -> поток
+
+    def should_run(index):
+        return not stop.is_set() and index < target["users"]
+
+    def spawn(index):
+        try:
+            # первые --browsers пользователей — настоящие браузеры
+            if index < browsers:
+                user = BrowserUser(index, base_url, catalog, stats, think=think,
+                                   browser=browser, headless=headless)
+            else:
+                user = HttpUser(index, base_url, catalog, stats, think=think)
+            user.run(should_run)
+        except Exception as e:
+            logger.error(f"Пользователь {index} остановился: {e}")
+
+    for users, seconds in stages:
+        target["users"] = users
+        logger.info(f"Нагрузка: {users} пользователей на {seconds}s")
+        # пользователи с индексом >= users сами выходят после текущей итерации
+        for index in range(users):
+            if index not in threads or not threads[index].is_alive():
+                threads[index] = threading.Thread(target=spawn, args=(index,), daemon=True)
+                threads[index].start()
+        time.sleep(seconds)
+
+    stop.set()
+    for thread in threads.values():
+        thread.join(timeout=60)
+    return stats.report()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Нагрузка на OpenCart сценариями тестов")
+    parser.add_argument("--base-url", default="https://demo.opencart.com")
+    parser.add_argument("--ramp", default="5:30", help="ступени users:seconds через запятую, напр. 5:30,20:60")
+    parser.add_argument("--browsers", type=int, default=0, help="сколько пользователей — настоящие браузеры")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true", help="не включать headless для браузеров")
+    parser.add_argument("--think", type=float, default=0.5, help="пауза между шагами, сек")
+    parser.add_argument("--out", default=".cache/load-report.json")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    report = run_load(args.base_url, parse_ramp(args.ramp), browsers=args.browsers,
+                      browser=args.browser, headless=not args.headed, think=args.think)
+
+    print(f"{'step':12} {'req':>6} {'rps':>7} {'err%':>6} {'p50':>7} {'p90':>7} {'p99':>7}")
+    for step in STEPS:
+        row = report["steps"].get(step)
+        if row:
+            print(f"{step:12} {row['requests']:6} {row['rps']:7} {row['error_rate'] * 100:6.1f} "
+                  f"{row['p50_ms'] or 0:7.0f} {row['p90_ms'] or 0:7.0f} {row['p99_ms'] or 0:7.0f}")
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"отчёт: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+# utils/locator_profiler.py
+"""
+Профилировщик локаторов: собирает все локаторы из pages/ и tests/, многократно вычисляет
+каждый прямо в странице и показывает число совпадений, время и более дешёвую замену.
+
+    python -m utils.locator_profiler --base-url http://localhost:8081 --runs 200
+"""
+
+import argparse
+import ast
+import json
+import logging
+import os
+import re
+
+from selenium.webdriver.common.by import By
+
+from utils.drivers import create_driver
+
+logger = logging.getLogger(__name__)
+
+BY_NAMES = {name: getattr(By, name) for name in ("ID", "NAME", "XPATH", "CSS_SELECTOR", "CLASS_NAME",
+                                                 "TAG_NAME", "LINK_TEXT", "PARTIAL_LINK_TEXT")}
+# вызовы, которые ждут список элементов — для них несколько совпадений нормальны
+LIST_CALLS = {"find_elements", "wait_all", "visibility_of_all_elements_located",
+              "visibility_of_any_elements_located", "presence_of_all_elements_located"}
+# вызовы utils.waits: селектор — второй позиционный аргумент, по умолчанию CSS
+WAIT_HELPERS = {"wait_element", "wait_all"}
+
+PAGES = {
+    "home": "/",
+    "category": "/index.php?route=product/category&path=20",
+    "product": "/index.php?route=product/product&path=57&product_id=49",
+    "register": "/index.php?route=account/register",
+}
+
+QUERY_JS = """
+function query(by, value) {
+    switch (by) {
+        case 'id': var el = document.getElementById(value); return el ? [el] : [];
+        case 'name': return document.getElementsByName(value);
+        case 'class name': return document.getElementsByClassName(value);
+        case 'tag name': return document.getElementsByTagName(value);
+        case 'link text':
+        case 'partial link text':
+            return Array.prototype.filter.call(document.links, function (a) {
+                var text = a.textContent.trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+        case 'xpath':
+            var snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snap.snapshotLength; i++) { nodes.push(snap.snapshotItem(i)); }
+            return nodes;
+        default: return document.querySelectorAll(value);
+    }
+}
+"""
+
+PROFILE_JS = QUERY_JS + """
+// ближайший предок с id, содержащий все совпадения: '#content .price' дешевле и точнее '.price'
+function scope(nodes) {
+    if (!nodes.length || !nodes[0].parentElement) { return null; }
+    for (var p = nodes[0].parentElement; p && p !== document.body; p = p.parentElement) {
+        if (!p.id) { continue; }
+        var all = true;
+        for (var i = 1; i < nodes.length; i++) { if (!p.contains(nodes[i])) { all = false; break; } }
+        if (all) { return p.id; }
+    }
+    return null;
+}
+var runs = arguments[1];
+return arguments[0].map(function (loc) {
+    var result = {count: 0, ms: null, error: null, scope: null, branches: null};
+    try {
+        var nodes = query(loc[0], loc[1]);
+        var t0 = performance.now();
+        for (var i = 0; i < runs; i++) { query(loc[0], loc[1]).length; }
+        result.ms = (performance.now() - t0) / runs;
+        result.count = nodes.length;
+        result.scope = scope(Array.prototype.slice.call(nodes));
+        if (loc[0] === 'css selector' && loc[1].indexOf(',') !== -1) {
+            result.branches = loc[1].split(',').map(function (b) {
+                return [b.trim(), document.querySelectorAll(b).length];
+            });
+        }
+    } catch (e) {
+        result.error = String(e);
+    }
+    return result;
+});
+"""
+
+# Совпадает ли CSS-замена с исходным локатором: те же узлы; с проверкой текста — надмножество
+# (лишнее отсеет проверка текста в Python, но пропустить нужный узел замена не может)
+VERIFY_JS = QUERY_JS + """
+return arguments[0].map(function (c) {
+    try {
+        var original = Array.prototype.slice.call(query(c[0], c[1]));
+        var found = Array.prototype.slice.call(document.querySelectorAll(c[2]));
+        var covered = original.every(function (n) { return found.indexOf(n) !== -1; });
+        return {ok: covered && (c[3] || found.length === original.length),
+                original: original.length, candidate: found.length, error: null};
+    } catch (e) {
+        return {ok: false, original: null, candidate: null, error: String(e)};
+    }
+});
+"""
+
+
+def _literal(node):
+    """Строка из Constant или f-строки (подстановки заменяются пустой строкой)."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value, False
+    if isinstance(node, ast.JoinedStr):
+        parts = [v.value for v in node.values if isinstance(v, ast.Constant)]
+        return "".join(parts), True
+    return None, False
+
+
+def _by(node):
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "By":
+        return BY_NAMES.get(node.attr)
+    return None
+
+
+class _Collector(ast.NodeVisitor):
+    def __init__(self, path):
+        self.path = path
+        self.found = []
+        self._class = None
+        self._target = None
+        self._call = None
+
+    def _add(self, node, by, value_node):
+        value, template = _literal(value_node)
+        if by is None or not value:
+            return
+        self.found.append({
+            "where": f"{self.path}:{node.lineno}",
+            "name": f"{self._class}.{self._target}" if self._class and self._target else self._target,
+            "by": by,
+            "value": value,
+            "template": template,
+            "single": self._call not in LIST_CALLS,
+        })
+
+    def visit_ClassDef(self, node):
+        outer, self._class = self._class, node.name
+        self.generic_visit(node)
+        self._class = outer
+
+    def visit_Assign(self, node):
+        target = node.targets[0]
+        self._target = target.id if isinstance(target, ast.Name) else None
+        self.generic_visit(node)
+        self._target = None
+
+    def visit_Tuple(self, node):
+        if len(node.elts) == 2 and _by(node.elts[0]):
+            self._add(node, _by(node.elts[0]), node.elts[1])
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        name = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, "id", None)
+        outer, self._call = self._call, name
+        if len(node.args) >= 2 and _by(node.args[0]):
+            # Element(By.X, "...") и find_element(s)(By.X, "...")
+            self._add(node, _by(node.args[0]), node.args[1])
+        elif name in WAIT_HELPERS and len(node.args) >= 2:
+            by = By.CSS_SELECTOR
+            for kw in node.keywords:
+                if kw.arg == "by":
+                    by = _by(kw.value)
+            self._add(node, by, node.args[1])
+        self.generic_visit(node)
+        self._call = outer
+
+
+def collect_locators(root=".", dirs=("pages", "tests")):
+    """Все литеральные локаторы из исходников, без дублей по (by, value)."""
+    unique = {}
+    for d in dirs:
+        for folder, _, files in os.walk(os.path.join(root, d)):
+            for filename in sorted(files):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.join(folder, filename)
+                with open(path, encoding="utf-8") as f:
+                    tree = ast.parse(f.read(), path)
+                collector = _Collector(os.path.relpath(path, root))
+                collector.visit(tree)
+                for loc in collector.found:
+                    key = (loc["by"], loc["value"])
+                    if key in unique:
+                        unique[key]["where"].append(loc["where"])
+                        unique[key]["single"] = unique[key]["single"] and loc["single"]
+                        unique[key]["name"] = unique[key]["name"] or loc["name"]
+                    else:
+                        unique[key] = {**loc, "where": [loc["where"]]}
+    return list(unique.values())
+
+
+_XPATH_STEP = re.compile(r"(//?)([\w*-]+)((?:\[[^\]]*\])*)")
+_CSS_IDENT = re.compile(r"-?[A-Za-z_][\w-]*")
+_XPATH_PRED = re.compile(r"\[\s*(?:@([\w-]+)\s*=\s*'([^']*)'|contains\(@([\w-]+),\s*'([^']*)'\)|(.*?))\s*\]")
+
+
+def xpath_to_css(xpath):
+    """
+    Простые XPath (оси / и //, предикаты по атрибутам) -> (css, нужна_проверка_текста).
+    None, если выражение так не переводится.
+    """
+    steps = _XPATH_STEP.findall(xpath)
+    if not steps or "".join(a + t + p for a, t, p in steps) != xpath:
+        return None
+    css, text_check = [], False
+    for i, (axis, tag, preds) in enumerate(steps):
+        part = "" if tag == "*" else tag
+        for attr, value, c_attr, c_value, other in _XPATH_PRED.findall(preds):
+            if attr == "id" and not _CSS_IDENT.fullmatch(value):
+                # '#form.currency' или '#1col' в CSS значат другое — только через атрибут
+                part += f"[id='{value}']"
+            elif attr == "id":
+                # id уникален — тег перед ним не нужен
+                part = f"#{value}" + part[len(tag):] if part.startswith(tag) else part + f"#{value}"
+            elif attr:
+                part += f"[{attr}='{value}']"
+            elif c_attr:
+                part += f"[{c_attr}*='{c_value}']"
+            elif "normalize-space" in other or "text()" in other:
+                text_check = True
+            else:
+                return None
+        css.append((" > " if axis == "/" and i else " ") + (part or "*"))
+    return "".join(css).strip(), text_check
+
+
+def candidate(loc, pages):
+    """
+    Более дешёвая замена по результатам на всех страницах: (css, нужна_проверка_текста, описание)
+    или None. css=None — только замечание, заменять нечем.
+    """
+    if loc["by"] == By.XPATH:
+        converted = xpath_to_css(loc["value"])
+        if converted:
+            css, text_check = converted
+            return css, text_check, f"CSS '{css}'" + (" + проверка текста в Python" if text_check else "")
+    if loc["by"] == By.CSS_SELECTOR:
+        branches = {}
+        for result in pages.values():
+            for branch, count in result.get("branches") or []:
+                branches[branch] = branches.get(branch, 0) + count
+        useful = [b for b, count in branches.items() if count]
+        if branches and len(useful) < len(branches):
+            if not useful:
+                return None, False, "ни одна ветка не совпала"
+            css = ", ".join(useful)
+            return css, False, f"оставить только совпадающие ветки: '{css}'"
+        scopes = {r["scope"] for r in pages.values() if r["count"] > 1}
+        if len(scopes) == 1 and None not in scopes and not loc["value"].startswith("#"):
+            css = f"#{scopes.pop()} {loc['value']}"
+            return css, False, f"сузить до '{css}'"
+    return None
+
+
+def suggest(loc, pages, checks=None):
+    """
+    Описание замены для отчёта (или None). checks — {страница: результат VERIFY_JS}: замена,
+    которая хоть на одной странице нашла не те узлы, не предлагается, а попадает в loc["rejected"].
+    """
+    found = candidate(loc, pages)
+    if not found:
+        return None
+    css, _, text = found
+    if css is None or checks is None:
+        return text
+    failed = {page: r for page, r in checks.items() if not r["ok"]}
+    if failed:
+        reasons = [f"{page} ({r['error'] or str(r['original']) + ' -> ' + str(r['candidate'])})"
+                   for page, r in failed.items()]
+        loc["rejected"] = f"{text} — не совпадает: {', '.join(reasons)}"
+        return None
+    return text
+
+
+def profile(driver, base_url, locators, runs=200, slow_ms=0.05):
+    payload = [[loc["by"], loc["value"]] for loc in locators]
+    for loc in locators:
+        loc["pages"] = {}
+    for page, path in PAGES.items():
+        driver.get(base_url.rstrip("/") + path)
+        for loc, result in zip(locators, driver.execute_script(PROFILE_JS, payload, runs)):
+            loc["pages"][page] = result
+
+    for loc in locators:
+        results = [r for r in loc["pages"].values() if not r["error"]]
+        loc["max_ms"] = max((r["ms"] for r in results), default=None)
+        loc["flags"] = []
+        if loc["max_ms"] is not None and loc["max_ms"] > slow_ms:
+            loc["flags"].append("slow")
+        if loc["single"] and any(r["count"] > 1 for r in results):
+            loc["flags"].append("ambiguous")
+        if not any(r["count"] for r in results):
+            loc["flags"].append("no-match")
+
+    # замены проверяются на тех же страницах: предлагаем только ту, что находит те же элементы
+    candidates = [(loc, candidate(loc, loc["pages"])) for loc in locators]
+    candidates = [(loc, found) for loc, found in candidates if found and found[0]]
+    checks = {id(loc): {} for loc, _ in candidates}
+    if candidates:
+        payload = [[loc["by"], loc["value"], found[0], found[1]] for loc, found in candidates]
+        for page, path in PAGES.items():
+            driver.get(base_url.rstrip("/") + path)
+            for (loc, _), result in zip(candidates, driver.execute_script(VERIFY_JS, payload)):
+                checks[id(loc)][page] = result
+    for loc in locators:
+        loc["suggestion"] = suggest(loc, loc["pages"], checks.get(id(loc)))
+    return sorted(locators, key=lambda loc: loc["max_ms"] or 0, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Стоимость и однозначность локаторов из pages/ и tests/")
+    parser.add_argument("--base-url", default="https://demo.opencart.com")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--runs", type=int, default=200, help="сколько раз вычислять каждый локатор")
+    parser.add_argument("--slow-ms", type=float, default=0.05, help="порог «медленного» локатора, мс")
+    parser.add_argument("--out", default=".cache/locators.json")
+    args = parser.parse_args(argv)
+
+    locators = collect_locators()
+    driver = create_driver(args.browser, headless=not args.headed)
+    try:
+        report = profile(driver, args.base_url, locators, runs=args.runs, slow_ms=args.slow_ms)
+    finally:
+        driver.quit()
+
+    for loc in report:
+        counts = " ".join(f"{page}={r['count'] if not r['error'] else 'ERR'}" for page, r in loc["pages"].items())
+        print(f"{loc['max_ms'] or 0:8.4f} ms  {','.join(loc['flags']) or '-':16} {loc['by']}={loc['value']!r}")
+        print(f"{'':12}{counts}  {loc['name'] or ''} {loc['where'][0]}")
+        if loc["suggestion"]:
+            print(f"{'':12}-> {loc['suggestion']}")
+        if loc.get("rejected"):
+            print(f"{'':12}x  {loc['rejected']}")
+    if args.out:
+        os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"отчёт: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
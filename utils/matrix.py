@@ -0,0 +1,171 @@
+# utils/matrix.py
+"""
+Кросс-браузерная матрица одним запуском: --browser chrome,firefox.
+
+Каждый браузер — отдельный процесс pytest с теми же аргументами, процессы идут одновременно,
+поэтому матрица стоит примерно max(ноги), а не их сумму. Результаты каждого — в
+<cache-dir>/matrix/<browser>.xml, общий отчёт с пространством имён [browser] — в
+<cache-dir>/matrix/report.xml и, если задан --junitxml, по этому пути.
+
+Ноги не делят файлы: у каждой свой --cache-dir (каталог товаров, impact-карта, timing),
+а тестовые товары админки удаляет один раз родитель, когда все ноги закончили.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# опции, которые у каждой ноги свои
+PER_LEG_OPTIONS = ("--browser", "--junitxml", "--junit-xml", "--timing-out", "--cache-dir", "--cleanup-prefix")
+
+
+def split_browsers(value):
+    """'chrome, firefox' -> ['chrome', 'firefox'] без повторов."""
+    browsers = []
+    for name in value.split(","):
+        name = name.strip().lower()
+        if name and name not in browsers:
+            browsers.append(name)
+    return browsers
+
+
+def leg_args(args, browser, junit_path, cache_dir, timing_out=None):
+    """
+    Аргументы исходного запуска, где --browser/--junitxml/--cache-dir/--timing-out заменены
+    на значения ноги, а очистка товаров админки выключена (её делает родитель).
+    """
+    result, skip = [], False
+    for arg in args:
+        if skip:
+            skip = False
+            continue
+        name = arg.split("=", 1)[0]
+        if name not in PER_LEG_OPTIONS:
+            result.append(arg)
+        else:
+            # значение отдельным аргументом — пропускаем и его
+            skip = "=" not in arg
+    result += [f"--browser={browser}", f"--junitxml={junit_path}", f"--cache-dir={cache_dir}", "--cleanup-prefix="]
+    if timing_out:
+        result.append(f"--timing-out={timing_out}")
+    return result
+
+
+class BrowserMatrix:
+    """Плагин: вместо прогона тестов в этом процессе запускает по процессу pytest на браузер."""
+
+    def __init__(self, config, browsers, cleanup=None):
+        self.config = config
+        self.browsers = browsers
+        self.cleanup = cleanup   # удаление тестовых товаров админки — один раз после всех ног
+        self.cache_dir = config.getoption("--cache-dir")
+        self.out_dir = os.path.join(str(config.rootpath), self.cache_dir, "matrix")
+        # свой junit-отчёт родителю не нужен (тестов в нём нет): по пути --junitxml пишем сводный.
+        # Срабатывает, только если вызвано раньше pytest_configure плагина junitxml (tryfirst в conftest)
+        self.junit_path = config.option.xmlpath
+        config.option.xmlpath = None
+        self.legs = {}   # browser -> {returncode, seconds, junit, summary}
+        self.wall = None
+
+    def _run_leg(self, browser, args, lock):
+        started = time.monotonic()
+        proc = subprocess.Popen([sys.executable, "-m", "pytest", *args],
+                                cwd=str(self.config.invocation_params.dir),
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, encoding="utf-8", errors="replace")
+        for line in proc.stdout:
+            with lock:
+                sys.stdout.write(f"[{browser}] {line}")
+                sys.stdout.flush()
+        self.legs[browser]["returncode"] = proc.wait()
+        self.legs[browser]["seconds"] = round(time.monotonic() - started, 1)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.config.option.collectonly:
+            return None
+        os.makedirs(self.out_dir, exist_ok=True)
+        args = list(self.config.invocation_params.args)
+        # без явного --timing-out отчёт ноги и так ляжет в её --cache-dir
+        timing_out = self.config.getoption("--timing-out")
+        lock = threading.Lock()
+        threads = []
+        started = time.monotonic()
+        for browser in self.browsers:
+            junit = os.path.join(self.out_dir, f"{browser}.xml")
+            if os.path.exists(junit):
+                os.remove(junit)
+            self.legs[browser] = {"returncode": None, "seconds": None, "junit": junit, "summary": None}
+            prefix = f"{timing_out}-{browser}" if timing_out else None
+            leg_cache = os.path.join(self.cache_dir, "matrix", browser)
+            thread = threading.Thread(target=self._run_leg,
+                                      args=(browser, leg_args(args, browser, junit, leg_cache, prefix), lock))
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        self.wall = round(time.monotonic() - started, 1)
+        if self.cleanup and any(item.get_closest_marker("admin") for item in session.items):
+            self.cleanup()
+
+        merged = self.merge()
+        session.testsfailed = sum(leg["summary"]["failures"] + leg["summary"]["errors"]
+                                  for leg in self.legs.values() if leg["summary"])
+        paths = [os.path.join(self.out_dir, "report.xml")]
+        if self.junit_path:
+            paths.append(os.path.join(str(self.config.invocation_params.dir), os.path.expanduser(self.junit_path)))
+        for path in paths:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            ET.ElementTree(merged).write(path, encoding="utf-8", xml_declaration=True)
+        return True
+
+    def merge(self):
+        """Один <testsuites>: по testsuite на браузер, classname с префиксом браузера."""
+        merged = ET.Element("testsuites")
+        for browser, leg in self.legs.items():
+            if not os.path.exists(leg["junit"]):
+                logger.warning(f"[{browser}] junit-отчёт не создан (код выхода {leg['returncode']})")
+                continue
+            root = ET.parse(leg["junit"]).getroot()
+            suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+            summary = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+            for suite in suites:
+                suite.set("name", browser)
+                for key in summary:
+                    summary[key] += int(suite.get(key, 0))
+                for case in suite.iter("testcase"):
+                    case.set("classname", f"{browser}.{case.get('classname', '')}")
+                    case.set("name", f"[{browser}] {case.get('name', '')}")
+                merged.append(suite)
+            leg["summary"] = summary
+        return merged
+
+    def pytest_sessionfinish(self, session):
+        codes = [leg["returncode"] for leg in self.legs.values() if leg["returncode"] is not None]
+        if codes and any(codes):
+            # хотя бы одна нога упала — общий код ненулевой; берём самый «тяжёлый»
+            session.exitstatus = max(codes)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.legs:
+            return
+        tr = terminalreporter
+        tr.section("browser matrix")
+        for browser, leg in self.legs.items():
+            s = leg["summary"]
+            counts = (f"tests={s['tests']} failures={s['failures']} errors={s['errors']} skipped={s['skipped']}"
+                      if s else "нет отчёта")
+            tr.write_line(f"[{browser:8}] {leg['seconds']}s  exit={leg['returncode']}  {counts}",
+                          red=bool(leg["returncode"]))
+        legs_total = sum(leg["seconds"] or 0 for leg in self.legs.values())
+        tr.write_line(f"матрица: {self.wall}s (последовательно было бы ~{round(legs_total, 1)}s)")
+        tr.write_line(f"отчёт: {os.path.join(self.out_dir, 'report.xml')}"
+                      + (f", {self.junit_path}" if self.junit_path else ""))
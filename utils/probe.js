@@ -0,0 +1,125 @@
+// utils/probe.js — пакет массовых запросов к DOM для тестов.
+// Ставится в страницу один раз (window.__probe), пока не сменится VERSION или сама страница.
+// Меняя поведение функций, поднимайте VERSION: иначе в открытой странице останется старая копия.
+(function () {
+    var VERSION = '3';
+
+    function visible(el) {
+        return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    }
+
+    function text(el) {
+        return (el.innerText || '').replace(/\s+/g, ' ').trim();
+    }
+
+    function scopeOf(css) {
+        return css ? document.querySelector(css) : document;
+    }
+
+    var ERRORS = '.text-danger, .invalid-feedback';
+
+    function fieldOf(el) {
+        // сообщение OpenCart лежит рядом с полем: в той же группе .mb-3/.form-group/.col
+        if (el.id && el.id.indexOf('error-') === 0) { return el.id.substring(6); }
+        var group = el.closest('.mb-3, .form-group, .col, .col-sm-10, fieldset') || el.parentElement;
+        var input = group && group.querySelector('input, select, textarea');
+        return input ? (input.name || input.id) : null;
+    }
+
+    var probe = window.__probe = {
+        version: VERSION,
+
+        // видимые тексты цен в области
+        priceTexts: function (scope) {
+            var root = scopeOf(scope);
+            if (!root) { return []; }
+            return Array.prototype.filter.call(root.querySelectorAll('.price'), visible).map(text);
+        },
+
+        // ссылки на карточки товаров в области, без повторов, в порядке документа
+        productLinks: function (scope) {
+            var root = scopeOf(scope), seen = {}, links = [];
+            if (!root) { return links; }
+            Array.prototype.forEach.call(root.querySelectorAll('a[href]'), function (a) {
+                var href = a.href;
+                if ((href.indexOf('product_id=') !== -1 || href.indexOf('route=product/product') !== -1) && !seen[href]) {
+                    seen[href] = true;
+                    links.push(href);
+                }
+            });
+            return links;
+        },
+
+        // видимые уведомления: [{type: 'success' | 'danger' | 'warning' | 'info', text}];
+        // fresh — только появившиеся после outcomeArm
+        alerts: function (fresh) {
+            return Array.prototype.filter.call(document.querySelectorAll('.alert'), function (el) {
+                return visible(el) && !(fresh && el.hasAttribute('data-probe-seen'));
+            }).map(function (el) {
+                var match = /alert-(success|danger|warning|info)/.exec(el.className);
+                return {type: match ? match[1] : 'info', text: text(el)};
+            }).filter(function (a) { return a.text; });
+        },
+
+        // ошибки валидации у полей: [{field, text}];
+        // fresh — только появившиеся или изменившиеся после outcomeArm (в списке товаров админки
+        // .text-danger — это спеццены и выключенные товары, а не ошибки)
+        formErrors: function (scope, fresh) {
+            var root = scopeOf(scope);
+            if (!root) { return []; }
+            return Array.prototype.filter.call(root.querySelectorAll(ERRORS), function (el) {
+                return visible(el) && !(fresh && el.getAttribute('data-probe-seen') === text(el));
+            }).map(function (el) { return {field: fieldOf(el), text: text(el)}; })
+                .filter(function (e) { return e.text; });
+        },
+
+        // текст индикатора корзины в шапке (разные темы OpenCart)
+        cartText: function () {
+            var selectors = ['#cart-total', '#cart .dropdown-toggle', '#header-cart .dropdown-toggle', '#cart > button'];
+            for (var i = 0; i < selectors.length; i++) {
+                var el = document.querySelector(selectors[i]);
+                if (el && text(el)) { return text(el); }
+            }
+            return '';
+        },
+
+        // перед отправкой формы: уже показанные уведомления и тексты ошибок не считаются её результатом
+        outcomeArm: function () {
+            Array.prototype.forEach.call(document.querySelectorAll('.alert'), function (el) {
+                el.setAttribute('data-probe-seen', '1');
+            });
+            Array.prototype.forEach.call(document.querySelectorAll(ERRORS), function (el) {
+                // запоминаем показанный текст: пустой/скрытый элемент, заполненный ответом, — новая ошибка
+                el.setAttribute('data-probe-seen', visible(el) ? text(el) : '');
+            });
+            return location.href;
+        },
+
+        // исход отправки формы: success | invalid | alert | pending
+        // spec: {urls: [подстрока URL], texts: [[css, подстрока текста]], alertSuccess, scope}
+        outcome: function (spec) {
+            var heading = document.querySelector('h1');
+            var result = {
+                state: 'pending',
+                url: location.href,
+                heading: heading ? text(heading) : '',
+                errors: probe.formErrors(spec.scope || '', true),
+                alerts: probe.alerts(true)
+            };
+            var success = spec.urls.some(function (part) { return result.url.indexOf(part) !== -1; })
+                || spec.texts.some(function (pair) {
+                    var el = document.querySelector(pair[0]);
+                    return el && visible(el) && text(el).indexOf(pair[1]) !== -1;
+                })
+                || (spec.alertSuccess && result.alerts.some(function (a) { return a.type === 'success'; }));
+            if (success) {
+                result.state = 'success';
+            } else if (result.errors.length) {
+                result.state = 'invalid';
+            } else if (result.alerts.some(function (a) { return a.type === 'danger' || a.type === 'warning'; })) {
+                result.state = 'alert';
+            }
+            return result;
+        }
+    };
+})();
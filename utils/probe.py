@@ -0,0 +1,61 @@
+# utils/probe.py
+"""
+Python-обёртки над utils/probe.js: каждый запрос — один execute_script.
+
+Пакет ставится в страницу при первом обращении после загрузки (и при смене версии),
+дальше вызовы только читают DOM.
+"""
+
+import os
+import re
+
+with open(os.path.join(os.path.dirname(__file__), "probe.js"), encoding="utf-8") as f:
+    PROBE_JS = f.read()
+PROBE_VERSION = re.search(r"VERSION = '([^']+)'", PROBE_JS).group(1)
+
+# исходник уходит с каждым вызовом, но выполняется только если пакета в странице ещё нет:
+# так обходимся одним запросом к драйверу вместо «проверить, поставить, вызвать»
+CALL_JS = """
+if (!window.__probe || window.__probe.version !== arguments[0]) { (new Function(arguments[1]))(); }
+return window.__probe[arguments[2]].apply(null, arguments[3]);
+"""
+
+
+def call(driver, name, *args):
+    return driver.execute_script(CALL_JS, PROBE_VERSION, PROBE_JS, name, list(args))
+
+
+def price_texts(driver, scope="body"):
+    """Видимые тексты всех .price внутри scope."""
+    return call(driver, "priceTexts", scope)
+
+
+def product_links(driver, scope=""):
+    """href всех ссылок на товары внутри scope (пусто — вся страница), без повторов."""
+    return call(driver, "productLinks", scope)
+
+
+def visible_alerts(driver, fresh=False):
+    """[{type, text}] видимых .alert; fresh — только появившиеся после outcome_arm."""
+    return call(driver, "alerts", fresh)
+
+
+def form_errors(driver, scope="", fresh=False):
+    """[{field, text}] видимых ошибок валидации у полей; fresh — только новые после outcome_arm."""
+    return call(driver, "formErrors", scope, fresh)
+
+
+def cart_text(driver):
+    """Текст индикатора корзины в шапке."""
+    return call(driver, "cartText")
+
+
+def outcome_arm(driver):
+    """Помечает уже показанные уведомления перед отправкой формы; возвращает текущий URL."""
+    return call(driver, "outcomeArm")
+
+
+def outcome(driver, urls=(), texts=(), alert_success=False, scope=""):
+    """Снимок исхода отправки формы: {state, url, heading, errors, alerts}."""
+    spec = {"urls": list(urls), "texts": [list(t) for t in texts], "alertSuccess": alert_success, "scope": scope}
+    return call(driver, "outcome", spec)
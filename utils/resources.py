@@ -0,0 +1,162 @@
+# utils/resources.py
+
+import json
+import logging
+import os
+import threading
+import time
+
+import pytest
+
+try:
+    import psutil
+except ImportError:  # мониторинг просто выключается
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+HISTORY_NAME = "resources-history.json"   # в --cache-dir
+
+
+def driver_pid(driver):
+    """PID процесса chromedriver/geckodriver (None, если драйвер удалённый)."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+class ResourceSampler:
+    """Фоновый поток: CPU и RSS процесса драйвера вместе со всеми дочерними процессами браузера."""
+
+    def __init__(self, pid, interval=0.5):
+        self.root = psutil.Process(pid)
+        self.interval = interval
+        self.rss = []
+        self.cpu = []
+        self._procs = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name=f"resources-{pid}", daemon=True)
+
+    def _sample(self):
+        try:
+            procs = [self.root] + self.root.children(recursive=True)
+        except psutil.Error:
+            return
+        rss, cpu = 0, 0.0
+        for proc in procs:
+            # cpu_percent считается между вызовами, поэтому Process переиспользуем
+            proc = self._procs.setdefault(proc.pid, proc)
+            try:
+                rss += proc.memory_info().rss
+                cpu += proc.cpu_percent(None)
+            except psutil.Error:
+                continue
+        self.rss.append(rss / 2 ** 20)
+        self.cpu.append(cpu)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    @property
+    def peak_rss(self):
+        return max(self.rss, default=0.0)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join(timeout=self.interval * 4)
+        count = len(self.rss) or 1
+        return {
+            "peak_rss_mb": round(self.peak_rss, 1),
+            "avg_rss_mb": round(sum(self.rss) / count, 1),
+            "peak_cpu": round(max(self.cpu, default=0.0), 1),
+            "avg_cpu": round(sum(self.cpu) / count, 1),
+            "samples": len(self.rss),
+        }
+
+
+class ResourceMonitor:
+    """Плагин: пиковые и средние CPU/RSS браузера по каждому тесту, бюджет памяти на тест."""
+
+    def __init__(self, config):
+        self.interval = config.getoption("--resources-interval")
+        self.budget = config.getoption("--mem-budget-mb")
+        self.action = config.getoption("--mem-budget-action")
+        self.preset = "lean" if config.getoption("--lean") else "default"
+        self.history_path = os.path.join(str(config.rootpath), config.getoption("--cache-dir"), HISTORY_NAME)
+        self.samplers = {}
+        self.results = {}
+
+    def start(self, item, driver):
+        pid = driver_pid(driver)
+        if pid is None:
+            return
+        try:
+            self.samplers[item.nodeid] = ResourceSampler(pid, self.interval).start()
+        except psutil.Error as e:
+            logger.warning(f"Не удалось начать мониторинг PID {pid}: {e}")
+
+    def stop(self, item):
+        sampler = self.samplers.pop(item.nodeid, None)
+        if sampler is None:
+            return
+        result = self.results[item.nodeid] = sampler.stop()
+        item.user_properties.extend((f"resources_{k}", v) for k, v in result.items())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        sampler = self.samplers.get(item.nodeid)
+        if call.when != "call" or not self.budget or sampler is None or sampler.peak_rss <= self.budget:
+            return
+        message = f"Браузер занял {sampler.peak_rss:.0f} MB при бюджете {self.budget} MB"
+        if self.action == "fail" and report.passed:
+            report.outcome = "failed"
+            report.longrepr = message
+        else:
+            report.sections.append(("resources", message))
+
+    def _save_history(self, summary):
+        try:
+            with open(self.history_path, encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = {}
+        history[self.preset] = summary
+        os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+        with open(self.history_path, "w", encoding="utf-8") as f:
+            json.dump(history, f, indent=1)
+        return history
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.results:
+            return
+        tr = terminalreporter
+        tr.section(f"browser resources ({self.preset})")
+        heavy = sorted(self.results.items(), key=lambda kv: kv[1]["peak_rss_mb"], reverse=True)
+        for nodeid, r in heavy[:10]:
+            tr.write_line(f"{r['peak_rss_mb']:8.1f} MB peak {r['avg_rss_mb']:8.1f} MB avg "
+                          f"{r['avg_cpu']:6.1f}% cpu  {nodeid}")
+
+        peaks = [r["peak_rss_mb"] for r in self.results.values()]
+        summary = {
+            "tests": len(peaks),
+            "avg_peak_rss_mb": round(sum(peaks) / len(peaks), 1),
+            "max_peak_rss_mb": max(peaks),
+            "time": time.time(),
+        }
+        tr.write_line(f"в среднем {summary['avg_peak_rss_mb']} MB на тест, максимум {summary['max_peak_rss_mb']} MB")
+
+        history = self._save_history(summary)
+        other = history.get("default" if self.preset == "lean" else "lean")
+        if other:
+            lean, default = (summary, other) if self.preset == "lean" else (other, summary)
+            saved = default["avg_peak_rss_mb"] - lean["avg_peak_rss_mb"]
+            percent = 100 * saved / default["avg_peak_rss_mb"] if default["avg_peak_rss_mb"] else 0
+            tr.write_line(f"--lean экономит {saved:.1f} MB на тест ({percent:.0f}%) "
+                          f"по последним прогонам обоих пресетов")
@@ -0,0 +1,130 @@
+# utils/standby.py
+"""
+Запасные браузеры: пока идёт тест, следующий драйвер уже запускается в фоне.
+Фикстура browser получает готовый чистый браузер сразу, а время его запуска
+не попадает в длительность теста.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+
+class StandbyPool:
+    """Держит size тёплых запасных драйверов; factory() запускает новый драйвер."""
+
+    def __init__(self, factory, size=1):
+        self.factory = factory
+        self.size = size
+        self.spares = queue.Queue()   # (driver, секунд на запуск) | (None, ошибка) — фоновый запуск упал
+        self.lock = threading.Lock()
+        self.threads = []
+        self.pending = 0
+        self.closed = False
+        self.broken = None   # ошибка фонового запуска: дальше запускаем синхронно
+        self.stats = {"served": 0, "warm": 0, "hidden": 0.0, "waited": 0.0}
+
+    def _launch(self):
+        driver = None
+        try:
+            started = time.monotonic()
+            driver = self.factory()
+            if not self.closed:
+                self.spares.put((driver, time.monotonic() - started))
+                driver = None
+        except Exception as e:
+            logger.warning(f"Запасной браузер не запустился: {e}")
+            self.broken = e
+            # будим acquire, который ждёт этот запуск: он запустит браузер сам
+            self.spares.put((None, e))
+        finally:
+            # после put: acquire не должен увидеть «ни в очереди, ни в запуске»
+            with self.lock:
+                self.pending -= 1
+        if driver is not None:
+            driver.quit()
+
+    def fill(self):
+        """Дозапускает запасные в фоне до size."""
+        with self.lock:
+            self.threads = [t for t in self.threads if t.is_alive()]
+            while not self.closed and not self.broken and self.spares.qsize() + self.pending < self.size:
+                self.pending += 1
+                thread = threading.Thread(target=self._launch, name="standby-browser", daemon=True)
+                self.threads.append(thread)
+                thread.start()
+
+    def _take_warm(self):
+        while True:
+            # запасной уже запускается — дождаться его не дольше, чем запустить новый
+            block = self.pending > 0 and not self.broken
+            try:
+                driver, elapsed = self.spares.get(block=block, timeout=120 if block else None)
+            except queue.Empty:
+                return None, 0
+            if driver is None:
+                return None, 0
+            try:
+                driver.current_url   # браузер мог умереть, пока ждал
+                return driver, elapsed
+            except WebDriverException:
+                logger.warning("Запасной браузер не отвечает, берём следующий")
+                try:
+                    driver.quit()
+                except WebDriverException:
+                    pass
+
+    def acquire(self):
+        """Чистый драйвер: тёплый из запаса, а если его ещё нет — запуск на месте."""
+        started = time.monotonic()
+        driver, elapsed = self._take_warm()
+        if driver is not None:
+            waited = time.monotonic() - started
+            self.stats["warm"] += 1
+            self.stats["hidden"] += max(0.0, elapsed - waited)
+            self.stats["waited"] += waited
+        else:
+            started = time.monotonic()
+            driver = self.factory()
+            self.stats["waited"] += time.monotonic() - started
+        self.stats["served"] += 1
+        self.fill()
+        return driver
+
+    def close(self):
+        self.closed = True
+        for thread in self.threads:
+            thread.join(timeout=60)
+        while True:
+            try:
+                driver, _ = self.spares.get_nowait()
+            except queue.Empty:
+                break
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except WebDriverException as e:
+                logger.debug(f"Запасной браузер не закрылся: {e}")
+
+    def pytest_sessionstart(self, session):
+        if not session.config.option.collectonly:
+            self.fill()
+
+    def pytest_sessionfinish(self):
+        self.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        s = self.stats
+        if not s["served"]:
+            return
+        terminalreporter.write_line(
+            f"standby: браузеров выдано {s['served']}, из запаса {s['warm']}; "
+            f"скрыто запуска {s['hidden']:.1f}s, ждали запуска {s['waited']:.1f}s")
+        if self.broken:
+            terminalreporter.write_line(f"standby: фоновый запуск отключён: {self.broken}", yellow=True)
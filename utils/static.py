@@ -0,0 +1,271 @@
+# utils/static.py
+"""
+Статический уровень: проверки наличия элементов без браузера.
+
+Страница скачивается через общий requests.Session с пулом соединений и разбирается lxml,
+URL из маркеров visit тестов static скачиваются параллельно сразу после сборки тестов,
+локаторы page objects (CSS, ID, NAME, CLASS_NAME, TAG_NAME, LINK_TEXT, простой XPath)
+вычисляются по готовому DOM. Если локатор так не вычислить или элемент может быть скрыт
+стилями/появляется только после JS, StaticDriver спрашивает настоящий браузер — он
+запускается лениво, только для такой страницы. Страница, которая не скачалась (ошибка
+соединения, HTTP 4xx/5xx), целиком проверяется в браузере.
+"""
+
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from selenium.webdriver.common.by import By
+
+from utils.http import pooled_session
+
+try:
+    import lxml.html
+    from lxml.cssselect import CSSSelector
+    from cssselect import SelectorError
+    from lxml.etree import ParserError, XPathError
+except ImportError:  # без lxml/cssselect статический уровень выключен
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+# классы Bootstrap, которые прячут элемент стилями — по одному HTML видимость не понять
+HIDING_CLASSES = {"d-none", "dropdown-menu", "collapse", "modal", "tab-pane", "invisible"}
+NON_RENDERED_TAGS = {"head", "script", "style", "template", "noscript", "title", "meta", "link"}
+
+_ids = itertools.count(1)
+
+
+def _key(url):
+    # base_url и base_url + "/" — одна страница кеша
+    return url.split("#")[0].rstrip("/")
+
+
+class NeedsBrowser(Exception):
+    """Локатор или элемент нельзя проверить по статическому HTML."""
+
+
+def _possibly_hidden(node):
+    for el in itertools.chain([node], node.iterancestors()):
+        if el.tag in NON_RENDERED_TAGS or el.get("hidden") is not None:
+            return True
+        if el.tag == "input" and el.get("type") == "hidden":
+            return True
+        style = (el.get("style") or "").replace(" ", "").lower()
+        if "display:none" in style or "visibility:hidden" in style:
+            return True
+        classes = set((el.get("class") or "").split())
+        if classes & HIDING_CLASSES and not classes & {"show", "active"}:
+            return True
+    return False
+
+
+def select(root, by, value):
+    """Узлы lxml по локатору Selenium; NeedsBrowser, если локатор здесь не вычисляется."""
+    try:
+        if by == By.ID:
+            return root.xpath("//*[@id=$v]", v=value)
+        if by == By.NAME:
+            return root.xpath("//*[@name=$v]", v=value)
+        if by == By.CLASS_NAME:
+            return root.xpath("//*[contains(concat(' ', normalize-space(@class), ' '), $v)]", v=f" {value} ")
+        if by == By.TAG_NAME:
+            return root.xpath(f"//{value}") if value.isalnum() else CSSSelector(value)(root)
+        if by == By.CSS_SELECTOR:
+            return CSSSelector(value)(root)
+        if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = root.xpath("//a")
+            if by == By.LINK_TEXT:
+                return [a for a in links if a.text_content().strip() == value]
+            return [a for a in links if value in a.text_content()]
+        if by == By.XPATH:
+            nodes = root.xpath(value)
+            if not isinstance(nodes, list) or not all(hasattr(n, "tag") for n in nodes):
+                raise NeedsBrowser(f"XPath возвращает не элементы: {value}")
+            return nodes
+    except (SelectorError, XPathError) as e:
+        raise NeedsBrowser(f"{by}={value}: {e}") from e
+    raise NeedsBrowser(f"неизвестная стратегия {by}")
+
+
+class StaticElement:
+    """Минимум WebElement для ожиданий и проверок наличия: текст, атрибуты, видимость."""
+
+    def __init__(self, node):
+        self.node = node
+        self.id = f"static-{next(_ids)}"
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return " ".join(self.node.text_content().split())
+
+    def get_attribute(self, name):
+        return self.node.get(name)
+
+    def is_displayed(self):
+        # скрытые элементы сюда не попадают — StaticDriver отдаёт их браузеру
+        return True
+
+    def is_enabled(self):
+        return self.node.get("disabled") is None
+
+    def is_selected(self):
+        return self.node.get("checked") is not None or self.node.get("selected") is not None
+
+
+class StaticClient:
+    """Общий HTTP-клиент статического уровня: пул соединений, кеш страниц, статистика."""
+
+    def __init__(self, base_url, workers=16, timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.workers = workers
+        self.timeout = timeout
+        self.session = pooled_session(workers)
+        self.lock = threading.Lock()
+        self.pages = {}   # _key(url) -> (итоговый url, дерево)
+        self.stats = {"fetched": 0, "hits": 0, "static": 0, "prefetched": 0, "fallbacks": {}}
+
+    def _download(self, url):
+        resp = self.session.get(url, timeout=self.timeout)
+        resp.raise_for_status()
+        page = (resp.url, lxml.html.fromstring(resp.content, base_url=resp.url))
+        with self.lock:
+            self.stats["fetched"] += 1
+            self.pages[_key(url)] = page
+        return page
+
+    def page(self, url):
+        """(итоговый url, дерево); ошибки requests/разбора HTML пробрасываются вызывающему."""
+        with self.lock:
+            if _key(url) in self.pages:
+                self.stats["hits"] += 1
+                return self.pages[_key(url)]
+        return self._download(url)
+
+    def prefetch(self, urls):
+        """Скачивает страницы параллельно; что не скачалось, тест потом проверит в браузере."""
+        urls = list({_key(url): url for url in urls if _key(url) not in self.pages}.values())
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls))) as pool:
+            for url, future in [(url, pool.submit(self._download, url)) for url in urls]:
+                try:
+                    future.result()
+                    self.stats["prefetched"] += 1
+                except (requests.RequestException, ParserError) as e:
+                    logger.warning(f"static: не удалось заранее скачать {url}: {e}")
+
+    def pytest_collection_finish(self, session):
+        if session.config.option.collectonly:
+            return
+        self.prefetch(self.base_url + item.get_closest_marker("visit").args[0]
+                      for item in session.items
+                      if item.get_closest_marker("static") and item.get_closest_marker("visit"))
+
+    def record(self, by, value, reason=None):
+        with self.lock:
+            if reason is None:
+                self.stats["static"] += 1
+            else:
+                key = f"{by}={value}: {reason}"
+                self.stats["fallbacks"][key] = self.stats["fallbacks"].get(key, 0) + 1
+
+    def close(self):
+        self.session.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.stats["fetched"]:
+            return
+        tr = terminalreporter
+        s = self.stats
+        tr.section("static tier")
+        tr.write_line(f"страниц скачано: {s['fetched']} (заранее {s['prefetched']}), из кеша: {s['hits']}, "
+                      f"локаторов без браузера: {s['static']}, через браузер: {sum(s['fallbacks'].values())}")
+        for key, count in sorted(s["fallbacks"].items(), key=lambda kv: -kv[1]):
+            tr.write_line(f"  браузер x{count}: {key}")
+
+
+class StaticDriver:
+    """
+    Подмена WebDriver для тестов с маркером static: get/title/find_element(s) по статическому HTML.
+    fallback — фабрика настоящего драйвера, вызывается только когда без JS не обойтись.
+    """
+
+    def __init__(self, client, fallback):
+        self.client = client
+        self._fallback_factory = fallback
+        self._fallback = None
+        self._fallback_url = None
+        self.session_id = "static"
+        self.current_url = None
+        self._root = None
+        self._broken = None   # почему страница не скачалась — тогда всё через браузер
+
+    def get(self, url):
+        try:
+            self.current_url, self._root = self.client.page(url)
+            self._broken = None
+        except (requests.RequestException, ParserError) as e:
+            self.current_url, self._root = url, None
+            self._broken = f"страница не скачалась: {e}"
+            self.client.record("get", url, self._broken)
+            logger.warning(f"static -> browser: {url}: {e}")
+
+    @property
+    def title(self):
+        if self._root is None:
+            return self.browser.title
+        titles = self._root.xpath("//head/title")
+        return titles[0].text_content().strip() if titles else ""
+
+    @property
+    def browser(self):
+        """Настоящий драйвер на текущей странице (запускается при первой необходимости)."""
+        if self._fallback is None:
+            self._fallback = self._fallback_factory()
+        if self._fallback_url != self.current_url:
+            self._fallback.get(self.current_url)
+            self._fallback_url = self.current_url
+        return self._fallback
+
+    def _static(self, by, value, first=False):
+        if self._root is None:
+            raise NeedsBrowser(self._broken or "страница не открыта")
+        nodes = select(self._root, by, value)
+        if not nodes:
+            raise NeedsBrowser("нет в HTML ответа")
+        # find_element проверяет видимость только первого совпадения
+        if any(_possibly_hidden(n) for n in (nodes[:1] if first else nodes)):
+            raise NeedsBrowser("видимость зависит от стилей")
+        self.client.record(by, value)
+        return [StaticElement(n) for n in nodes]
+
+    def find_elements(self, by=By.ID, value=None):
+        try:
+            return self._static(by, value)
+        except NeedsBrowser as e:
+            self.client.record(by, value, str(e))
+            logger.debug(f"static -> browser: {by}={value}: {e}")
+            return self.browser.find_elements(by, value)
+
+    def find_element(self, by=By.ID, value=None):
+        try:
+            return self._static(by, value, first=True)[0]
+        except NeedsBrowser as e:
+            self.client.record(by, value, str(e))
+            logger.debug(f"static -> browser: {by}={value}: {e}")
+            return self.browser.find_element(by, value)
+
+    def save_screenshot(self, filename):
+        return self._fallback.save_screenshot(filename) if self._fallback else False
+
+    def quit(self):
+        if self._fallback is not None:
+            self._fallback.quit()
+            self._fallback = None
@@ -0,0 +1,85 @@
+# utils/tabs.py
+
+import logging
+import time
+from collections import deque
+
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException, WebDriverException,
+)
+
+logger = logging.getLogger(__name__)
+
+# пока страница грузится, эти ошибки означают «ещё не готово», а не провал
+_NOT_READY = (NoSuchElementException, StaleElementReferenceException)
+
+
+class TabRunner:
+    """
+    Параллельные read-only проверки страниц во вкладках одного браузера.
+
+    Драйвер должен быть запущен с page_load_strategy="none": тогда get() не блокирует,
+    и загрузки во всех вкладках идут одновременно, а runner по кругу переключается
+    между вкладками и опрашивает готовность каждой.
+    """
+
+    def __init__(self, driver, tabs=4, timeout=30, poll=0.1):
+        self.driver = driver
+        self.tabs = tabs
+        self.timeout = timeout
+        self.poll = poll
+
+    def _open_tabs(self, count):
+        handles = [self.driver.current_window_handle]
+        while len(handles) < count:
+            self.driver.switch_to.new_window("tab")
+            handles.append(self.driver.current_window_handle)
+        return handles
+
+    def _start(self, handle, check):
+        name, url, _ = check
+        self.driver.switch_to.window(handle)
+        self.driver.get(url)
+        return {"check": check, "started": time.monotonic(), "name": name}
+
+    def _probe(self, task):
+        """True — проверка прошла, False — ещё ждём; исключение — провал."""
+        _, _, condition = task["check"]
+        if self.driver.execute_script("return document.readyState") == "loading":
+            return False
+        try:
+            return bool(condition(self.driver))
+        except _NOT_READY:
+            return False
+
+    def run(self, checks):
+        """
+        checks — список (name, url, condition), где condition(driver) ведёт себя как условие WebDriverWait.
+        Возвращает {name: {"ok": bool, "error": str, "elapsed": float}}.
+        """
+        queue = deque(checks)
+        handles = self._open_tabs(min(self.tabs, len(queue)))
+        active = {h: self._start(h, queue.popleft()) for h in handles if queue}
+        results = {}
+
+        while active:
+            for handle in list(active):
+                task = active[handle]
+                self.driver.switch_to.window(handle)
+                elapsed = time.monotonic() - task["started"]
+                try:
+                    done = self._probe(task)
+                    error = "" if done else (f"таймаут {self.timeout}s" if elapsed > self.timeout else None)
+                except (AssertionError, WebDriverException) as e:
+                    done, error = False, str(e) or type(e).__name__
+                if done or error is not None:
+                    results[task["name"]] = {"ok": done, "error": error or "", "elapsed": round(elapsed, 3)}
+                    logger.debug(f"{task['name']}: ok={done} за {elapsed:.2f}s")
+                    del active[handle]
+                    if queue:
+                        active[handle] = self._start(handle, queue.popleft())
+            if active:
+                time.sleep(self.poll)
+
+        self.driver.switch_to.window(handles[0])
+        return results
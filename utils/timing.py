@@ -0,0 +1,147 @@
+# utils/timing.py
+
+import csv
+import json
+import logging
+import os
+from urllib.parse import urlparse, parse_qs
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+METRICS = ("ttfb", "dom_content_loaded", "load")
+
+# Navigation Timing и самые медленные ресурсы текущего документа
+TIMING_JS = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return null; }
+var slowest = performance.getEntriesByType('resource')
+    .map(function (r) { return {name: r.name, type: r.initiatorType, duration: Math.round(r.duration)}; })
+    .sort(function (a, b) { return b.duration - a.duration; })
+    .slice(0, arguments[0]);
+return {
+    url: location.href,
+    ttfb: Math.round(nav.responseStart - nav.startTime),
+    dom_content_loaded: Math.round(nav.domContentLoadedEventEnd - nav.startTime),
+    load: Math.round(nav.loadEventEnd - nav.startTime),
+    transfer_size: nav.transferSize || 0,
+    time_origin: performance.timeOrigin,
+    slowest: slowest
+};
+"""
+
+
+def route_of(url, admin_path="/administration"):
+    """Ключ маршрута OpenCart: 'product/category', 'admin:common/dashboard', 'common/home'."""
+    parsed = urlparse(url)
+    route = parse_qs(parsed.query).get("route", [""])[0]
+    admin = False
+    if admin_path:
+        # по целому сегменту пути: /administration-old — уже не админка
+        prefix = admin_path.rstrip("/")
+        admin = parsed.path == prefix or parsed.path.startswith(prefix + "/")
+    if admin:
+        return "admin:" + (route or "common/login")
+    return route or "common/home"
+
+
+def percentile(values, p):
+    """Перцентиль по методу ближайшего ранга."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))
+    return ordered[int(rank) - 1]
+
+
+class TimingCollector:
+    """Собирает Navigation/Resource Timing после каждого driver.get и агрегирует по маршрутам."""
+
+    def __init__(self, out_prefix, admin_path="/administration", slowest=5):
+        self.out_prefix = out_prefix
+        self.admin_path = admin_path
+        self.slowest = slowest
+        self.entries = []
+        self._seen = set()   # (url, timeOrigin) уже записанных документов
+
+    def attach(self, driver):
+        """Оборачивает driver.get: замер попадает и из BasePage.open, и из «сырых» browser.get в тестах.
+
+        Перед уходом со страницы она тоже замеряется — так в отчёт попадают переходы по кликам
+        (например, дашборд админки после логина).
+        """
+        original_get = driver.get
+
+        def get(url):
+            self.collect(driver)
+            original_get(url)
+            self.collect(driver)
+
+        driver.get = get
+        return driver
+
+    def collect(self, driver):
+        try:
+            data = driver.execute_script(TIMING_JS, self.slowest)
+        except WebDriverException as e:
+            logger.debug(f"Navigation Timing недоступен: {e}")
+            return None
+        if not data:
+            return None
+        key = (data["url"], data["time_origin"])
+        if key in self._seen or data["url"].startswith(("data:", "about:")):
+            return None
+        self._seen.add(key)
+        data["route"] = route_of(data["url"], self.admin_path)
+        self.entries.append(data)
+        return data
+
+    def aggregate(self):
+        routes = {}
+        for entry in self.entries:
+            routes.setdefault(entry["route"], []).append(entry)
+
+        summary = {}
+        for route, entries in sorted(routes.items()):
+            row = {"count": len(entries)}
+            for metric in METRICS:
+                # load=0/отрицательный — страница ещё не догрузилась (page_load_strategy=none)
+                values = [e[metric] for e in entries if e[metric] > 0]
+                for p in (50, 90, 95):
+                    row[f"{metric}_p{p}"] = percentile(values, p)
+                row[f"{metric}_max"] = max(values, default=None)
+            slowest = {}
+            for e in entries:
+                for res in e["slowest"]:
+                    if res["duration"] > slowest.get(res["name"], {}).get("duration", -1):
+                        slowest[res["name"]] = res
+            row["slowest"] = sorted(slowest.values(), key=lambda r: r["duration"], reverse=True)[:self.slowest]
+            summary[route] = row
+        return summary
+
+    def export(self):
+        summary = self.aggregate()
+        os.makedirs(os.path.dirname(self.out_prefix) or ".", exist_ok=True)
+        with open(self.out_prefix + ".json", "w", encoding="utf-8") as f:
+            json.dump({"routes": summary, "entries": self.entries}, f, ensure_ascii=False, indent=1)
+
+        columns = ["route", "count"] + [f"{m}_{s}" for m in METRICS for s in ("p50", "p90", "p95", "max")]
+        with open(self.out_prefix + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+            writer.writeheader()
+            for route, row in summary.items():
+                writer.writerow({"route": route, **row})
+        return summary
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.entries:
+            return
+        summary = self.export()
+        tr = terminalreporter
+        tr.section("navigation timing, ms (p50 / p95)")
+        for route, row in summary.items():
+            tr.write_line(f"{route:40} n={row['count']:<3} ttfb {row['ttfb_p50']} / {row['ttfb_p95']}  "
+                          f"dcl {row['dom_content_loaded_p50']} / {row['dom_content_loaded_p95']}  "
+                          f"load {row['load_p50']} / {row['load_p95']}")
+        tr.write_line(f"подробности: {self.out_prefix}.json, {self.out_prefix}.csv")
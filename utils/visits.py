@@ -0,0 +1,99 @@
+# utils/visits.py
+"""
+Общие визиты страниц (--shared-visits): тесты с маркером visit("/путь") идут подряд по URL
+и работают в одном браузере на сессию. Страница грузится один раз на группу read-only тестов,
+visit(..., mutating=True) получает свежую загрузку с чистыми cookie.
+
+Включается явно: перестановка тестов меняет порядок всего прогона и может спрятать
+зависимости тестов друг от друга. Без флага маркер visit ни на что не влияет.
+"""
+
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize(url):
+    return (url or "").split("#")[0].rstrip("/")
+
+
+class SharedVisits:
+    def __init__(self, config):
+        self.base_url = config.getoption("--base-url").rstrip("/")
+        self.driver = None
+        self._original_get = None
+        self._absorb = None   # URL, который страница уже показывает для текущего теста
+        self.dirty = False
+        self._current = None   # (nodeid, mutating) теста на общем драйвере
+        self.stats = {"tests": 0, "loads": 0}
+
+    def url_of(self, item):
+        marker = item.get_closest_marker("visit")
+        return self.base_url + marker.args[0] if marker else None
+
+    @staticmethod
+    def is_mutating(item):
+        marker = item.get_closest_marker("visit")
+        return bool(marker and marker.kwargs.get("mutating"))
+
+    def pytest_collection_modifyitems(self, items):
+        """Тесты одного URL — подряд (на месте первого из них), мутирующие — в конце группы."""
+        groups = {}
+        order = []
+        for item in items:
+            url = self.url_of(item)
+            if url is None:
+                order.append([item])
+                continue
+            if url not in groups:
+                groups[url] = []
+                order.append(groups[url])
+            groups[url].append(item)
+        for group in groups.values():
+            group.sort(key=self.is_mutating)
+        items[:] = [item for chunk in order for item in chunk]
+
+    def _get(self, url):
+        # первый get теста на уже загруженную страницу ничего не делает
+        if self._absorb and _normalize(url) == self._absorb:
+            self._absorb = None
+            return
+        self._absorb = None
+        self._original_get(url)
+
+    def driver_for(self, item, factory):
+        """Общий драйвер с загруженной страницей теста."""
+        if self.driver is None:
+            self.driver = factory()
+            self._original_get = self.driver.get
+            self.driver.get = self._get
+        url = self.url_of(item)
+        self.stats["tests"] += 1
+        self._current = (item.nodeid, self.is_mutating(item))
+        if self.dirty or self.is_mutating(item) or _normalize(self.driver.current_url) != _normalize(url):
+            if self.dirty or self.is_mutating(item):
+                self.driver.delete_all_cookies()
+            self._original_get(url)
+            self.stats["loads"] += 1
+            self.dirty = False
+        self._absorb = _normalize(url)
+        return self.driver
+
+    def pytest_runtest_logreport(self, report):
+        # после мутирующего или упавшего теста состояние страницы не доверяем
+        if self._current and report.nodeid == self._current[0] and report.when == "call":
+            if report.failed or self._current[1]:
+                self.dirty = True
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.stats["tests"]:
+            terminalreporter.write_line(
+                f"shared visits: {self.stats['tests']} тестов на {self.stats['loads']} загрузках страниц")
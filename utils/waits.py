@@ -6,9 +6,27 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from utils.budget import budget
+
+
+class BudgetWait(WebDriverWait):
+    """WebDriverWait, чей таймаут ужимается по бюджету на каждом until, а не один раз при создании."""
+
+    def __init__(self, driver, timeout=10, **kwargs):
+        super().__init__(driver, timeout, **kwargs)
+        self.requested = timeout
+
+    def until(self, method, message=""):
+        self._timeout = budget.timeout(self.requested)
+        return super().until(method, message)
+
+    def until_not(self, method, message=""):
+        self._timeout = budget.timeout(self.requested)
+        return super().until_not(method, message)
+
 def wait_element(driver, selector, by=By.CSS_SELECTOR, timeout=7):
     try:
-        return WebDriverWait(driver, timeout).until(
+        return WebDriverWait(driver, budget.timeout(timeout)).until(
             EC.visibility_of_element_located((by, selector))
         )
     except TimeoutException:
@@ -17,7 +35,7 @@ def wait_element(driver, selector, by=By.CSS_SELECTOR, timeout=7):
 
 def wait_all(driver, selector, by=By.CSS_SELECTOR, timeout=7):
     try:
-        return WebDriverWait(driver, timeout).until(
+        return WebDriverWait(driver, budget.timeout(timeout)).until(
             EC.visibility_of_all_elements_located((by, selector))
         )
     except TimeoutException:
@@ -26,6 +44,6 @@ def wait_all(driver, selector, by=By.CSS_SELECTOR, timeout=7):
 
 def wait_title(driver, title, timeout=7):
     try:
-        WebDriverWait(driver, timeout).until(EC.title_is(title))
+        WebDriverWait(driver, budget.timeout(timeout)).until(EC.title_is(title))
     except TimeoutException:
         raise AssertionError(f"Ожидал title='{title}', а был '{driver.title}'")